@@ -50,11 +50,10 @@ def dt_utc_to_local(utc_dt):
 
 
 def wait_uptime(min_s: float):
-    while True:
-        uptime = float(open('/proc/uptime', 'r').readline().split()[0])
-        if uptime > min_s:
-            break
-        time.sleep(0.1)
+    # CLOCK_BOOTTIME is the system uptime (suspend included), as /proc/uptime but without file read and parse
+    remaining_s = min_s - time.clock_gettime(time.CLOCK_BOOTTIME)
+    if remaining_s > 0:
+        time.sleep(remaining_s)
 
 
 def byte_xor(data_1: bytes, data_2: bytes) -> bytes:
@@ -112,4 +111,4 @@ class CustomRedis(redis.Redis):
         if js_as_bytes is None:
             return
         else:
-            return json.loads(js_as_bytes.decode('utf-8'))
+            return json.loads(js_as_bytes)
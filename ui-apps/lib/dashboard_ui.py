@@ -1,22 +1,24 @@
 #!/usr/bin/env python3
 
-from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from datetime import date, datetime, timedelta
 import copy
 import functools
+import hashlib
+import heapq
 import io
 import json
 import math
 import os
 import subprocess
-import tempfile
 from typing import Any, Callable, List, Union
-import locale
 import logging
 import queue
 import threading
 import time
 import traceback
 import tkinter as tk
+import tkinter.font
 import redis
 import PIL.Image
 import PIL.ImageDraw
@@ -57,22 +59,22 @@ def catch_log_except(catch=None, log_lvl=logging.ERROR, limit_arg_len=40):
     if catch is None:
         catch = Exception
 
+    def _clip(arg_repr: str) -> str:
+        return arg_repr if len(arg_repr) < limit_arg_len else arg_repr[:limit_arg_len - 2] + '..'
+
     def _catch_log_except(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except catch as e:
+                # skip message build if this log level is disabled
+                if not logging.getLogger().isEnabledFor(log_lvl):
+                    return
                 # format function call "f_name(args..., kwargs...)" string (with arg/kwargs len limit)
-                func_args = ''
-                for arg in args:
-                    func_args += ', ' if func_args else ''
-                    func_args += repr(arg) if len(repr(arg)) < limit_arg_len else repr(arg)[:limit_arg_len - 2] + '..'
-                for k, v in kwargs.items():
-                    func_args += ', ' if func_args else ''
-                    func_args += repr(k) + '='
-                    func_args += repr(v) if len(repr(v)) < limit_arg_len else repr(v)[:limit_arg_len - 2] + '..'
-                func_call = f'{func.__name__}({func_args})'
+                args_l = [_clip(repr(arg)) for arg in args]
+                args_l += [f'{k!r}={_clip(repr(v))}' for k, v in kwargs.items()]
+                func_call = f'{func.__name__}({", ".join(args_l)})'
                 # log message "except [except class] in f_name(args..., kwargs...): [except msg]"
                 logging.log(log_lvl, f'except {type(e)} in {func_call}: {e}')
 
@@ -82,46 +84,84 @@ def catch_log_except(catch=None, log_lvl=logging.ERROR, limit_arg_len=40):
 
 
 def wait_uptime(min_s: float):
-    while True:
-        uptime = float(open('/proc/uptime', 'r').readline().split()[0])
-        if uptime > min_s:
-            break
-        time.sleep(0.1)
+    # CLOCK_BOOTTIME is the system uptime (suspend included), as /proc/uptime but without file read and parse
+    remaining_s = min_s - time.clock_gettime(time.CLOCK_BOOTTIME)
+    if remaining_s > 0:
+        time.sleep(remaining_s)
 
 
 def fmt_value(value: Any, fmt: str = '', alt_str: str = 'n/a') -> str:
     return alt_str if value is None else f'{value:{fmt}}'
 
 
+def dict_path(obj: Any, path: Union[str, list, tuple]) -> Any:
+    # return item at path in nested dicts/lists (None if path is unavailable)
+    # ensure path is an iterable
+    if not type(path) in (tuple, list):
+        path = [path]
+    try:
+        for cur_lvl in path:
+            obj = obj[cur_lvl]
+        return obj
+    except (KeyError, TypeError, IndexError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def shared_font(font: Union[str, tuple]) -> tkinter.font.Font:
+    # return a tk named font build from a font description, it's create once and shared by all widgets
+    # (need a tk root, so call it only from widgets code)
+    return tkinter.font.Font(font=font)
+
+
 # some class
 class AsyncTask:
     """ A class to implement items async processing (run in a separate thread). """
 
-    def __init__(self, max_items: int = 20) -> None:
+    def __init__(self, max_items: int = 20, workers: int = 1) -> None:
         # init an items queue
         self._queue = queue.Queue(maxsize=max_items)
-        # start a thread to manage items in queue
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        # with several workers, each one get items one by one (share the load), otherwise process them by batch
+        self._batch_max = 64 if workers == 1 else 1
+        # start thread(s) to manage items in queue
+        self._threads_l = [threading.Thread(target=self._run, daemon=True) for _ in range(workers)]
+        for thread in self._threads_l:
+            thread.start()
 
     def _run(self) -> None:
         while True:
+            # wait for an item, then drain all items already queued to process them as a batch
+            items_l = [self._queue.get()]
             try:
-                item = self._queue.get()
-                self.do(item)
+                while len(items_l) < self._batch_max:
+                    items_l.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                self.do_batch(items_l)
             except Exception as e:
                 logging.warning(f'except {type(e).__name__} in {type(self).__name__}: {e}')
             finally:
-                self._queue.task_done()
+                for _ in items_l:
+                    self._queue.task_done()
+
+    def do_batch(self, items_l: List[Any]) -> None:
+        # default: process items one by one (override it to process a batch at once, like a redis pipeline)
+        for item in items_l:
+            try:
+                self.do(item)
+            except Exception as e:
+                logging.warning(f'except {type(e).__name__} in {type(self).__name__}: {e}')
 
     def do(self, item: Any) -> None:
         raise NotImplemented
 
-    def add(self, item: Any) -> None:
+    def add(self, item: Any) -> bool:
         try:
             self._queue.put_nowait(item)
+            return True
         except queue.Full:
-            pass
+            return False
 
 
 class CustomRedis(redis.Redis):
@@ -141,54 +181,101 @@ class CustomRedis(redis.Redis):
 
     @catch_log_except(catch=(redis.RedisError, AttributeError, json.decoder.JSONDecodeError), log_lvl=LOG_LEVEL)
     def get_js(self, name):
-        return json.loads(super().get(name).decode('utf-8'))
+        # json.loads() accept bytes (no intermediate str)
+        js_as_bytes = super().get(name)
+        return None if js_as_bytes is None else json.loads(js_as_bytes)
+
+
+class RedisRead:
+    """ A redis read command, use it as a Tag read method: the Tags IO thread batch these reads in a pipeline. """
+    __slots__ = ('redis_cli', 'cmd', 'args', 'js')
+
+    def __init__(self, redis_cli: redis.Redis, cmd: str, *args: Any, js: bool = False) -> None:
+        # public
+        self.redis_cli = redis_cli
+        self.cmd = cmd
+        self.args = args
+        self.js = js
+
+    def __call__(self) -> Any:
+        # run the command alone
+        return self.result(getattr(self.redis_cli, self.cmd)(*self.args))
+
+    def queue(self, pipe: redis.client.Pipeline) -> None:
+        # add the command to a pipeline
+        getattr(pipe, self.cmd)(*self.args)
+
+    def result(self, raw: Any) -> Any:
+        # command reply to tag value (None on error)
+        if raw is None or isinstance(raw, Exception):
+            return None
+        if self.js:
+            try:
+                return json.loads(raw)
+            except (TypeError, ValueError):
+                return None
+        return raw
 
 
 class Tag:
+    # WARN: _value is never modified in place, it's only replaced by a new object
+    #       a reference read/write is atomic (GIL), so there is no need for a lock between IO and tk threads
+    __slots__ = ('version', '_value', '_read_cmd', '_write_cmd', '_th_io_every')
+    # set on any tag value change (a thread-safe flag for the tk side, see TilesTab), store lock protect versions
+    # against concurrent stores (IO thread, tk thread set())
+    changed_evt = threading.Event()
+    _store_lock = threading.Lock()
+
     def __init__(self, value=None, read: Callable = None, write: Callable = None, io_every: float = None) -> None:
+        # public
+        # version is increment on each value change (let consumers skip unchanged values)
+        self.version = 0
         # private
         self._value = value
         self._read_cmd = read
         self._write_cmd = write
-        self._lock = threading.Lock()
         self._th_io_every = io_every
-        self._th_last_run = 0.0
 
     def io_update(self, ref: str = '') -> None:
-        # method call by Tags io thread
+        # method call by Tags io thread (when this tag is due, see TagsBase scheduler)
         if self._th_io_every:
-            t_now = time.monotonic()
-            run_now = (t_now - self._th_last_run) > self._th_io_every
             # if read method is define, do it
-            if run_now:
-                self._th_last_run = t_now
-                # if read method is define, do it
-                if callable(self._read_cmd):
-                    logging.debug(f'IO thread call read cmd' + f' [ref {ref}]' if ref else f'')
-                    # secure call to read method callback, catch any exception
-                    try:
-                        cache_value = self._read_cmd()
-                    except Exception:
-                        cache_value = None
-                    # update internal tag value
-                    with self._lock:
-                        self._value = cache_value
-                # if write method is define, do it
-                if callable(self._write_cmd):
-                    logging.debug(f'IO thread call write cmd' + f' [ref {ref}]' if ref else f'')
-                    # avoid lock thread during _write_cmd() IO stuff
-                    # read internal tag value
-                    with self._lock:
-                        cached_value = self._value
-                    # secure call to write method callback, catch any exception
-                    try:
-                        self._write_cmd(cached_value)
-                    except Exception:
-                        pass
+            if callable(self._read_cmd):
+                self._io_read(ref)
+            # if write method is define, do it
+            if callable(self._write_cmd):
+                self._io_write(ref)
+
+    def _io_read(self, ref: str = '') -> None:
+        logging.debug(f'IO thread call read cmd' + f' [ref {ref}]' if ref else f'')
+        # secure call to read method callback, catch any exception
+        try:
+            cache_value = self._read_cmd()
+        except Exception:
+            cache_value = None
+        # update internal tag value
+        self._store(cache_value)
+
+    def _store(self, value: object) -> None:
+        # replace value only on change (an unchanged value keep its object identity and the tag version)
+        if value != self._value:
+            with Tag._store_lock:
+                self._value = value
+                self.version += 1
+            Tag.changed_evt.set()
+
+    def _io_write(self, ref: str = '') -> None:
+        logging.debug(f'IO thread call write cmd' + f' [ref {ref}]' if ref else f'')
+        # read internal tag value
+        cached_value = self._value
+        # secure call to write method callback, catch any exception
+        try:
+            self._write_cmd(cached_value)
+        except Exception:
+            pass
 
     def set(self, value: object) -> None:
-        with self._lock:
-            self._value = value
+        self._store(value)
         # if tag don't use io_thread, call _write_cmd immediately
         if not self._th_io_every:
             if callable(self._write_cmd):
@@ -208,29 +295,28 @@ class Tag:
                     cached_value = self._read_cmd(**args)
                 except Exception:
                     cached_value = None
-                with self._lock:
-                    self._value = cached_value
+                self._store(cached_value)
         # if a path is define use it
         if path:
-            # ensure path is an iterable
-            if not type(path) in (tuple, list):
-                path = [path]
-            # explore path to retrieve item we want
-            with self._lock:
-                # ensure no reference to _value by copy
-                item = copy.copy(self._value)
-            try:
-                for cur_lvl in path:
-                    item = item[cur_lvl]
-                return item
-            # return None if path unavailable
-            except (KeyError, TypeError, IndexError):
-                return None
+            # explore path to retrieve item we want (nested items are never copy, no need to copy the top one)
+            return dict_path(self._value, path)
         else:
             # return simple value (avoid return reference with copy)
-            with self._lock:
-                # ensure no reference to _value by copy
-                return copy.copy(self._value)
+            # ensure no reference to _value by copy
+            return self._copy(self._value)
+
+    @staticmethod
+    def _copy(value: object) -> object:
+        # shallow copy with fast paths: C level copy for dict/list, no copy at all for immutable types
+        value_type = type(value)
+        if value_type is dict:
+            return value.copy()
+        elif value_type is list:
+            return value[:]
+        elif value_type in (str, int, float, bool, bytes, tuple, type(None)):
+            return value
+        else:
+            return copy.copy(value)
 
 
 class TagsBase:
@@ -238,24 +324,144 @@ class TagsBase:
     # WARNs: -> all tags with io_every set are manage by an independent (of tk mainloop) IO thread
     #           this thread periodically update tag value and avoid tk GUI loop do this and lose time on DB IO
     #        -> tags callbacks (read/write methods) are call by this IO thread (not by tkinter main thread)
-    __IO_THREAD_TAG_LIST = list()
+    # redis keyspace notifications (need "notify-keyspace-events" on server side and a pubsub ACL for the user):
+    # a tag with a RedisRead is read as soon as its key change, periodic read is just a safety net (slow down by
+    # IO_NOTIFY_POLL_FACTOR) while the subscription is up
+    IO_NOTIFY = False
+    IO_NOTIFY_POLL_FACTOR = 10
+    # IO thread schedule: a min-heap of (next run deadline, tag index, tag name, tag)
+    __IO_THREAD_HEAP = list()
+    # keyspace notify: tags to read now (name: tag), names of tags with an active subscription (and change flag)
+    __IO_NOTIFY_LOCK = threading.Lock()
+    __IO_NOTIFY_WAKEUP = threading.Event()
+    __IO_DIRTY = dict()
+    __IO_NOTIFY_NAMES = set()
+    __IO_NOTIFY_CHANGED = False
 
     @classmethod
     def init(cls):
-        # compile tag list for IO thread before starting it
-        for name, attr in cls.__dict__.items():
-            if not name.startswith('__') and isinstance(attr, Tag):
-                cls.__IO_THREAD_TAG_LIST.append((name, attr))
+        # compile tag schedule for IO thread before starting it (all tags are due at startup)
+        t_now = time.monotonic()
+        notify_d = dict()
+        for idx, (name, attr) in enumerate(cls.__dict__.items()):
+            if not name.startswith('__') and isinstance(attr, Tag) and attr._th_io_every:
+                cls.__IO_THREAD_HEAP.append((t_now, idx, name, attr))
+                # group notified tags by redis client and key
+                if cls.IO_NOTIFY and isinstance(attr._read_cmd, RedisRead) and attr._read_cmd.args:
+                    redis_cli = attr._read_cmd.redis_cli
+                    keys_d = notify_d.setdefault(id(redis_cli), (redis_cli, dict()))[1]
+                    keys_d.setdefault(attr._read_cmd.args[0], []).append((name, attr))
+        heapq.heapify(cls.__IO_THREAD_HEAP)
         # start IO thread
-        threading.Thread(target=cls._io_thread_task, daemon=True).start()
+        if cls.__IO_THREAD_HEAP:
+            threading.Thread(target=cls._io_thread_task, daemon=True).start()
+        # start a keyspace notify thread by redis client
+        for redis_cli, keys_d in notify_d.values():
+            threading.Thread(target=cls._io_notify_task, args=(redis_cli, keys_d), daemon=True).start()
 
     @classmethod
     def _io_thread_task(cls):
-        # IO thread main loop
+        # IO thread main loop: sleep until the next tag is due, update all due tags and reschedule them
+        heap = cls.__IO_THREAD_HEAP
+        notify_names = set()
+        while True:
+            # a keyspace notify can wake up the thread before the next deadline
+            if cls.__IO_NOTIFY_WAKEUP.wait(max(0.0, heap[0][0] - time.monotonic())):
+                cls.__IO_NOTIFY_WAKEUP.clear()
+            t_now = time.monotonic()
+            with cls.__IO_NOTIFY_LOCK:
+                dirty_d, cls.__IO_DIRTY = cls.__IO_DIRTY, dict()
+                notify_changed, cls.__IO_NOTIFY_CHANGED = cls.__IO_NOTIFY_CHANGED, False
+                if notify_changed:
+                    notify_names = set(cls.__IO_NOTIFY_NAMES)
+            # on subscription up/down: all tags are due now (missed changes, new polling period)
+            if notify_changed:
+                heap[:] = [(t_now, idx, name, tag) for _, idx, name, tag in heap]
+                heapq.heapify(heap)
+            due_l = []
+            while heap and heap[0][0] <= t_now:
+                due_l.append(heapq.heappop(heap))
+            # add notified tags (they keep their current deadline)
+            for _, _, name, _ in due_l:
+                dirty_d.pop(name, None)
+            cls._io_update_batch([(name, tag) for _, _, name, tag in due_l] + list(dirty_d.items()))
+            # next deadlines (don't try to catch up missed periods if IO is late)
+            t_now = time.monotonic()
+            for deadline, idx, name, tag in due_l:
+                every = tag._th_io_every
+                if name in notify_names:
+                    every *= cls.IO_NOTIFY_POLL_FACTOR
+                heapq.heappush(heap, (max(deadline + every, t_now), idx, name, tag))
+
+    @classmethod
+    def _io_notify_task(cls, redis_cli: redis.Redis, keys_d: dict) -> None:
+        # keyspace notify thread: mark tags as dirty when their key change, subscribe again on redis error
+        db = redis_cli.connection_pool.connection_kwargs.get('db', 0)
+        channels_d = {f'__keyspace@{db}__:{key}'.encode(): tags_l for key, tags_l in keys_d.items()}
+        names = {name for tags_l in keys_d.values() for name, _ in tags_l}
         while True:
-            for name, tag in cls.__IO_THREAD_TAG_LIST:
+            pubsub = redis_cli.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(*channels_d)
+                while True:
+                    msg = pubsub.get_message(timeout=1.0)
+                    if msg:
+                        # events are delivered (server config and ACL are ok): periodic reads can slow down now
+                        # (a subscription without any event, like on a server without notify-keyspace-events,
+                        # keep the normal polling period)
+                        cls._io_notify_status(names, up=True)
+                        with cls.__IO_NOTIFY_LOCK:
+                            for name, tag in channels_d.get(msg['channel'], []):
+                                cls.__IO_DIRTY[name] = tag
+                        cls.__IO_NOTIFY_WAKEUP.set()
+            except redis.RedisError as e:
+                logging.debug(f'keyspace notify error: {e!r}')
+            except Exception:
+                logging.error(traceback.format_exc())
+            finally:
+                # always back to normal polling before a new subscribe
+                cls._io_notify_status(names, up=False)
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+            time.sleep(5.0)
+
+    @classmethod
+    def _io_notify_status(cls, names: set, up: bool) -> None:
+        # update the set of notified tags, IO thread reschedule all tags on change
+        with cls.__IO_NOTIFY_LOCK:
+            if up == names.issubset(cls.__IO_NOTIFY_NAMES):
+                return
+            if up:
+                cls.__IO_NOTIFY_NAMES |= names
+            else:
+                cls.__IO_NOTIFY_NAMES -= names
+            cls.__IO_NOTIFY_CHANGED = True
+        cls.__IO_NOTIFY_WAKEUP.set()
+
+    @staticmethod
+    def _io_update_batch(tags_l: List[tuple]) -> None:
+        # update a list of (name, tag): redis reads of each redis client are done in a single pipeline (one RTT)
+        pipe_d = dict()
+        for name, tag in tags_l:
+            if isinstance(tag._read_cmd, RedisRead):
+                pipe_d.setdefault(id(tag._read_cmd.redis_cli), []).append((name, tag))
+            else:
                 tag.io_update(ref=name)
-            time.sleep(1.0)
+        for pipe_tags_l in pipe_d.values():
+            logging.debug(f'IO thread call a read pipeline for {len(pipe_tags_l)} tag(s)')
+            try:
+                pipe = pipe_tags_l[0][1]._read_cmd.redis_cli.pipeline(transaction=False)
+                for _, tag in pipe_tags_l:
+                    tag._read_cmd.queue(pipe)
+                raw_l = pipe.execute(raise_on_error=False)
+            except redis.RedisError:
+                raw_l = [None] * len(pipe_tags_l)
+            for (name, tag), raw in zip(pipe_tags_l, raw_l):
+                tag._store(tag._read_cmd.result(raw))
+                if callable(tag._write_cmd):
+                    tag._io_write(ref=name)
 
 
 # Tab library
@@ -263,6 +469,11 @@ class TilesTab(tk.Frame):
     """
     Base Tab class, with a frame full of tile, can be derived as you need it
     """
+    # period of the tags changed flag check (a displayed tab is updated at most this delay after a tag change)
+    # there is a single check loop for all tabs
+    CHANGES_POLL_MS = 500
+    _tabs_l = list()
+    _changes_poll_started = False
 
     def __init__(self, *args, tiles_size: tuple, **kwargs):
         tk.Frame.__init__(self, *args, **kwargs)
@@ -274,22 +485,60 @@ class TilesTab(tk.Frame):
         self._lbl_pady = round((self._screen_h / self.tiles_height) / 2)
         self._update_every_ms = None
         self._update_after_id = None
+        self._hidden_misses = 0
+        self._tags_versions = dict()
+        self._fill_tiles_d = dict()
         # tk stuff
-        # populate the grid with all tiles
+        # size the grid cells (a single call by row/column, no spacer widgets)
         for c in range(self.tiles_width):
-            for r in range(self.tiles_height):
-                self.grid_rowconfigure(r, weight=1)
-                # create Labels to space all of it
-                tk.Label(self, pady=self._lbl_pady, padx=self._lbl_padx).grid(column=c, row=r)
-                Tile(self).set_tile(row=r, column=c)
-            self.grid_columnconfigure(c, weight=1)
+            self.grid_columnconfigure(c, weight=1, minsize=2 * self._lbl_padx)
+        for r in range(self.tiles_height):
+            self.grid_rowconfigure(r, weight=1, minsize=2 * self._lbl_pady)
+        # populate cells leave empty by the derived class with a default tile (when tab build is done)
+        self.after_idle(self._fill_empty_cells)
         # init tab update
-        self.bind('<Visibility>', lambda evt: self.update())
+        self.bind('<Visibility>', self._on_visibility)
 
     @property
     def tiles_width(self):
         return self._tiles_size[0]
 
+    def tags_changed(self, *tags: Tag) -> bool:
+        # return True if one of these tags have a new value since the previous call with the same tags
+        # (so a tags set must be checked only once by update)
+        versions = tuple(tag.version for tag in tags)
+        if self._tags_versions.get(tags) == versions:
+            return False
+        self._tags_versions[tags] = versions
+        return True
+
+    def _fill_empty_cells(self):
+        # add a default tile to each free cell, remove the ones under a newer tile
+        # (call it again after any tiles rebuild: the result never depend on tiles creation order)
+        # find cells already used by a tile (include row/column span), default tiles excluded
+        fill_tiles = set(self._fill_tiles_d.values())
+        used_cells = set()
+        for widget in self.grid_slaves():
+            if widget in fill_tiles:
+                continue
+            info = widget.grid_info()
+            row, column = int(info['row']), int(info['column'])
+            for r in range(row, row + int(info['rowspan'])):
+                for c in range(column, column + int(info['columnspan'])):
+                    used_cells.add((r, c))
+        # update default tiles
+        for c in range(self.tiles_width):
+            for r in range(self.tiles_height):
+                fill_tile = self._fill_tiles_d.get((r, c))
+                if (r, c) in used_cells:
+                    if fill_tile is not None:
+                        fill_tile.destroy()
+                        del self._fill_tiles_d[(r, c)]
+                elif fill_tile is None:
+                    fill_tile = Tile(self)
+                    fill_tile.set_tile(row=r, column=c)
+                    self._fill_tiles_d[(r, c)] = fill_tile
+
     @property
     def tiles_height(self):
         return self._tiles_size[1]
@@ -303,13 +552,45 @@ class TilesTab(tk.Frame):
         # init loop
         if self._update_every_ms:
             self._do_cyclic_update()
+        # tags changes are also check by a single loop for all tabs (start it once)
+        if self not in TilesTab._tabs_l:
+            TilesTab._tabs_l.append(self)
+            self.bind('<Destroy>', lambda evt: TilesTab._tabs_l.remove(self), add='+')
+        if not TilesTab._changes_poll_started:
+            TilesTab._changes_poll_started = True
+            TilesTab._poll_changes(self._root())
+
+    @staticmethod
+    def _poll_changes(root: tk.Tk):
+        # on any tag value change (flag set by IO thread): schedule one update of displayed tabs when tk is idle
+        if Tag.changed_evt.is_set():
+            Tag.changed_evt.clear()
+            root.after_idle(TilesTab._update_displayed_tabs)
+        root.after(TilesTab.CHANGES_POLL_MS, TilesTab._poll_changes, root)
+
+    @staticmethod
+    def _update_displayed_tabs():
+        for tab in TilesTab._tabs_l:
+            if tab.winfo_viewable():
+                tab.update()
 
     def _do_cyclic_update(self):
-        # call update() if this tab is currently displayed
-        if self.winfo_ismapped():
+        # call update() if this tab is currently displayed, otherwise slow down the loop (up to 10x period)
+        # (winfo_viewable() check all ancestors: a tab nested in an unselected notebook frame is still mapped)
+        if self.winfo_viewable():
+            self._hidden_misses = 0
             self.update()
+        else:
+            self._hidden_misses = min(self._hidden_misses + 1, 9)
         # set next periodic call
-        self._update_after_id = self.after(self._update_every_ms, self._do_cyclic_update)
+        self._update_after_id = self.after(self._update_every_ms * (1 + self._hidden_misses), self._do_cyclic_update)
+
+    def _on_visibility(self, _evt):
+        # tab is displayed: restart update loop at normal rate (this also call update()) or just call update()
+        if self._update_every_ms:
+            self.init_cyclic_update(every_ms=self._update_every_ms)
+        else:
+            self.update()
 
     def update(self):
         pass
@@ -333,9 +614,9 @@ class PdfTilesTab(TilesTab):
 
     @file_list.setter
     def file_list(self, value):
-        # check type
+        # check type (redis hkeys return names as bytes)
         try:
-            value = sorted(list(value))
+            value = sorted(name.decode() if isinstance(name, bytes) else name for name in value)
         except (TypeError, ValueError):
             value = None
         # check change
@@ -381,6 +662,8 @@ class PdfTilesTab(TilesTab):
                     if c >= self.tiles_width - 1:
                         r += 1
                         c = 1
+            # default tiles for cells freed or used by this rebuild
+            self._fill_empty_cells()
         except Exception:
             logging.error(traceback.format_exc())
 
@@ -397,6 +680,7 @@ class Tile(tk.Frame):
         # private
         self._update_every_ms = None
         self._update_after_id = None
+        self._hidden_misses = 0
         # tk stuff
         self.configure(highlightbackground=Colors.TILE_BORDER)
         self.configure(highlightthickness=3)
@@ -407,6 +691,8 @@ class Tile(tk.Frame):
         # deny frame resize
         self.pack_propagate(False)
         self.grid_propagate(False)
+        # leave slow update rate as soon as tile is visible again
+        self.bind('<Visibility>', self._on_visibility, add='+')
 
     def add_on_click_cmd(self, cmd: Callable):
         self.bind('<Button-1>', lambda evt: cmd(), add='+')
@@ -428,11 +714,21 @@ class Tile(tk.Frame):
             self._do_cyclic_update()
 
     def _do_cyclic_update(self):
-        # call update() if this tile is currently displayed
-        if self.winfo_ismapped():
+        # call update() if this tile is currently displayed, otherwise slow down the loop (up to 10x period)
+        # use winfo_viewable(): in an unselected notebook tab only the tab frame is unmapped, its tiles are still
+        # mapped (winfo_ismapped() is True) but not viewable (the tab frame, an ancestor, is unmapped)
+        if self.winfo_viewable():
+            self._hidden_misses = 0
             self.update()
+        else:
+            self._hidden_misses = min(self._hidden_misses + 1, 9)
         # set next periodic call
-        self._update_after_id = self.after(self._update_every_ms, self._do_cyclic_update)
+        self._update_after_id = self.after(self._update_every_ms * (1 + self._hidden_misses), self._do_cyclic_update)
+
+    def _on_visibility(self, _evt):
+        # tile is displayed: if update loop was slow down, restart it at normal rate now
+        if self._hidden_misses and self._update_every_ms:
+            self.init_cyclic_update(every_ms=self._update_every_ms)
 
     def update(self):
         pass
@@ -453,7 +749,7 @@ class AirQualityTile(Tile):
         self._level_str.set('n/a')
         self._status_str.set('n/a')
         # tk job
-        tk.Label(self, text=city, font='bold', fg=Colors.TXT).pack()
+        tk.Label(self, text=city, font=shared_font('bold'), fg=Colors.TXT).pack()
         tk.Label(self).pack()
         tk.Label(self, textvariable=self._level_str, fg=Colors.TXT).pack()
         tk.Label(self, textvariable=self._status_str, fg=Colors.TXT).pack()
@@ -493,32 +789,46 @@ class AirQualityTile(Tile):
 
 
 class ClockTile(Tile):
+    # french day and month names (avoid a process-wide locale.setlocale() call)
+    DAY_NAMES = ('lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche')
+    MONTH_NAMES = ('janvier', 'février', 'mars', 'avril', 'mai', 'juin', 'juillet',
+                   'août', 'septembre', 'octobre', 'novembre', 'décembre')
+
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # private
         self._date_str = tk.StringVar()
         self._time_str = tk.StringVar()
-        # set locale (for french day name)
-        locale.setlocale(locale.LC_ALL, 'fr_FR.UTF-8')
+        self._last_date = None
         # tk stuff
-        tk.Label(self, textvariable=self._date_str, font=('bold', 16), bg=self.cget('bg'), anchor=tk.W,
+        tk.Label(self, textvariable=self._date_str, font=shared_font(('bold', 16)), bg=bg, anchor=tk.W,
                  justify=tk.LEFT, fg=Colors.TXT).pack(expand=True)
-        tk.Label(self, textvariable=self._time_str, font=('digital-7', 30), bg=self.cget('bg'),
+        tk.Label(self, textvariable=self._time_str, font=shared_font(('digital-7', 30)), bg=bg,
                  fg=Colors.TXT).pack(expand=True)
         # auto-update clock every 500ms
         self.init_cyclic_update(every_ms=500)
 
     def update(self):
-        self._date_str.set(datetime.now().strftime('%A %d %B %Y'))
-        self._time_str.set(datetime.now().strftime('%H:%M:%S'))
+        now = datetime.now()
+        # date string only change once a day
+        if now.date() != self._last_date:
+            self._last_date = now.date()
+            self._date_str.set(f'{self.DAY_NAMES[now.weekday()]} {now.day:02d} '
+                               f'{self.MONTH_NAMES[now.month - 1]} {now.year}')
+        self._time_str.set(f'{now.hour:02d}:{now.minute:02d}:{now.second:02d}')
 
 
 class DaysAccTileLoos(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # private
         self._date_dts = None
         self._date_digne = None
+        self._acc_date_dts = None
+        self._acc_date_digne = None
+        self._last_today = None
         self._days_dts_str = tk.StringVar()
         self._days_digne_str = tk.StringVar()
         # tk stuff
@@ -527,22 +837,22 @@ class DaysAccTileLoos(Tile):
             for r in range(3):
                 self.grid_rowconfigure(r, weight=1)
                 if c > 0:
-                    tk.Label(self, bg=self.cget('bg')).grid(row=r, column=c, )
+                    tk.Label(self, bg=bg).grid(row=r, column=c, )
             self.columnconfigure(c, weight=1)
         # add label
         tk.Label(self, text='La sécurité est notre priorité !',
-                 font=('courier', 20, 'bold'), bg=self.cget('bg'),
+                 font=shared_font(('courier', 20, 'bold')), bg=bg,
                  fg=Colors.TXT).grid(row=0, column=0, columnspan=2)
         # DTS
-        tk.Label(self, textvariable=self._days_dts_str, font=('courier', 24, 'bold'),
-                 bg=self.cget('bg'), fg=Colors.H_TXT).grid(row=1, column=0)
+        tk.Label(self, textvariable=self._days_dts_str, font=shared_font(('courier', 24, 'bold')),
+                 bg=bg, fg=Colors.H_TXT).grid(row=1, column=0)
         tk.Label(self, text='jours sans accident DTS',
-                 font=('courier', 18, 'bold'), bg=self.cget('bg'), fg=Colors.TXT).grid(row=1, column=1, sticky=tk.W)
+                 font=shared_font(('courier', 18, 'bold')), bg=bg, fg=Colors.TXT).grid(row=1, column=1, sticky=tk.W)
         # DIGNE
-        tk.Label(self, textvariable=self._days_digne_str, font=('courier', 24, 'bold'),
-                 bg=self.cget('bg'), fg=Colors.H_TXT).grid(row=2, column=0)
+        tk.Label(self, textvariable=self._days_digne_str, font=shared_font(('courier', 24, 'bold')),
+                 bg=bg, fg=Colors.H_TXT).grid(row=2, column=0)
         tk.Label(self, text='jours sans accident DIGNE',
-                 font=('courier', 18, 'bold'), bg=self.cget('bg'), fg=Colors.TXT).grid(row=2, column=1, sticky=tk.W)
+                 font=shared_font(('courier', 18, 'bold')), bg=bg, fg=Colors.TXT).grid(row=2, column=1, sticky=tk.W)
         # auto-update acc day counter every 5s
         self.init_cyclic_update(every_ms=5_000)
 
@@ -554,27 +864,43 @@ class DaysAccTileLoos(Tile):
         if self._date_dts != date_dts or self._date_digne != date_digne:
             self._date_dts = date_dts
             self._date_digne = date_digne
+            # parse dates once here, force update() to refresh counters
+            self._acc_date_dts = self.str_to_date(date_dts)
+            self._acc_date_digne = self.str_to_date(date_digne)
+            self._last_today = None
             self.update()
 
     def update(self):
-        self._days_dts_str.set(self.day_from_now(self._date_dts))
-        self._days_digne_str.set(self.day_from_now(self._date_digne))
+        # days counters only change at date rollover
+        today = date.today()
+        if today == self._last_today:
+            return
+        self._last_today = today
+        self._days_dts_str.set(self.days_since(self._acc_date_dts, today))
+        self._days_digne_str.set(self.days_since(self._acc_date_digne, today))
 
     @staticmethod
-    def day_from_now(date_str: str) -> str:
+    def str_to_date(date_str: str) -> date:
+        # "dd/mm/yyyy" string to date (None if invalid)
         try:
             day, month, year = map(int, str(date_str).split('/'))
-            return str((datetime.now() - datetime(year, month, day)).days)
+            return date(year, month, day)
         except (TypeError, ValueError):
-            return 'n/a'
+            return None
+
+    @staticmethod
+    def days_since(acc_date: date, today: date) -> str:
+        return 'n/a' if acc_date is None else str((today - acc_date).days)
 
 
 class DaysAccTileMessein(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # private
+        self._date_dts = None
         self._acc_date_dts = None
-        self._acc_date_digne = None
+        self._last_today = None
         self._days_dts_str = tk.StringVar()
         # tk stuff
         # populate tile with blank grid parts
@@ -582,17 +908,17 @@ class DaysAccTileMessein(Tile):
             for r in range(3):
                 self.grid_rowconfigure(r, weight=1)
                 if c > 0:
-                    tk.Label(self, bg=self.cget('bg')).grid(row=r, column=c, )
+                    tk.Label(self, bg=bg).grid(row=r, column=c, )
             self.columnconfigure(c, weight=1)
         # add label
         tk.Label(self, text='La sécurité est notre priorité !',
-                 font=('courier', 16, 'bold'), bg=self.cget('bg'),
+                 font=shared_font(('courier', 16, 'bold')), bg=bg,
                  fg=Colors.TXT).grid(row=0, column=0, columnspan=2)
         # DTS
-        tk.Label(self, textvariable=self._days_dts_str, font=('courier', 22, 'bold'),
-                 bg=self.cget('bg'), fg=Colors.H_TXT).grid(row=1, column=0)
+        tk.Label(self, textvariable=self._days_dts_str, font=shared_font(('courier', 22, 'bold')),
+                 bg=bg, fg=Colors.H_TXT).grid(row=1, column=0)
         tk.Label(self, text='jours sans accident DTS',
-                 font=('courier', 14, 'bold'), bg=self.cget('bg'), fg=Colors.TXT).grid(row=1, column=1, sticky=tk.W)
+                 font=shared_font(('courier', 14, 'bold')), bg=bg, fg=Colors.TXT).grid(row=1, column=1, sticky=tk.W)
         # auto-update acc day counter every 5s
         self.init_cyclic_update(every_ms=5_000)
 
@@ -602,18 +928,31 @@ class DaysAccTileMessein(Tile):
         # on change -> update widget
         if self._date_dts != date_dts:
             self._date_dts = date_dts
+            # parse date once here, force update() to refresh counter
+            self._acc_date_dts = self.str_to_date(date_dts)
+            self._last_today = None
             self.update()
 
     def update(self):
-        self._days_dts_str.set(self.day_from_now(self._acc_date_dts))
+        # days counter only change at date rollover
+        today = date.today()
+        if today == self._last_today:
+            return
+        self._last_today = today
+        self._days_dts_str.set(self.days_since(self._acc_date_dts, today))
 
     @staticmethod
-    def day_from_now(date_str: str) -> str:
+    def str_to_date(date_str: str) -> date:
+        # "dd/mm/yyyy" string to date (None if invalid)
         try:
             day, month, year = map(int, str(date_str).split('/'))
-            return str((datetime.now() - datetime(year, month, day)).days)
+            return date(year, month, day)
         except (TypeError, ValueError):
-            return 'n/a'
+            return None
+
+    @staticmethod
+    def days_since(acc_date: date, today: date) -> str:
+        return 'n/a' if acc_date is None else str((today - acc_date).days)
 
 
 class EmptyTile(Tile):
@@ -624,6 +963,7 @@ class EmptyTile(Tile):
 class FlysprayTile(Tile):
     def __init__(self, *args, title: str = '', **kwargs) -> None:
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # public
         self.title = title
         # private
@@ -631,10 +971,10 @@ class FlysprayTile(Tile):
         self._msg_text = tk.StringVar()
         self._msg_text.set('n/a')
         # tk job
-        tk.Label(self, text=self.title, bg=self.cget('bg'), fg=Colors.TXT,
-                 font=('courier', 14, 'bold', 'underline')).pack()
-        tk.Label(self, textvariable=self._msg_text, bg=self.cget('bg'), fg=Colors.TXT,
-                 wraplength=750, justify=tk.LEFT, font=('courier', 13, 'bold')).pack(expand=True)
+        tk.Label(self, text=self.title, bg=bg, fg=Colors.TXT,
+                 font=shared_font(('courier', 14, 'bold', 'underline'))).pack()
+        tk.Label(self, textvariable=self._msg_text, bg=bg, fg=Colors.TXT,
+                 wraplength=750, justify=tk.LEFT, font=shared_font(('courier', 13, 'bold'))).pack(expand=True)
 
     def load(self, task_l: List[str]) -> None:
         # enforce type
@@ -651,13 +991,10 @@ class FlysprayTile(Tile):
         TTE_MAX_NB = 12
         TTE_MAX_LEN = 75
         try:
-            msg = ''
-            # limit titles number
-            for title in self._task_l[:TTE_MAX_NB]:
-                # limit title length
-                title = (title[:TTE_MAX_LEN - 2] + '..') if len(title) > TTE_MAX_LEN else title
-                msg += '%s\n' % title
-            self._msg_text.set(msg)
+            # limit titles number and titles length
+            titles = [(title[:TTE_MAX_LEN - 2] + '..') if len(title) > TTE_MAX_LEN else title
+                      for title in self._task_l[:TTE_MAX_NB]]
+            self._msg_text.set(''.join(f'{title}\n' for title in titles))
         except Exception:
             self._msg_text.set('n/a')
 
@@ -678,7 +1015,7 @@ class GaugeTile(Tile):
         self._head_str = None
         self._percent = None
         # tk build
-        self.label = tk.Label(self, textvariable=self._str_title, font='bold', bg=Colors.BG, fg=Colors.TXT)
+        self.label = tk.Label(self, textvariable=self._str_title, font=shared_font('bold'), bg=Colors.BG, fg=Colors.TXT)
         self.label.grid(sticky=tk.NSEW)
         self.can = tk.Canvas(self, width=220, height=110, borderwidth=2, relief='sunken', bg='white')
         self.can.grid()
@@ -692,8 +1029,9 @@ class GaugeTile(Tile):
             percent = float(percent)
         except (TypeError, ValueError):
             percent = None
+        # (a missing head string must not be show as 'None')
         try:
-            head_str = str(head_str)
+            head_str = None if head_str is None else str(head_str)
         except:
             head_str = None
         # on change -> update widget
@@ -719,13 +1057,13 @@ class GaugeTile(Tile):
             else:
                 self.can.configure(bg=Colors.GREEN)
             if self._head_str:
-                self._str_title.set('%s (%s)' % (self.title, self._head_str))
+                self._str_title.set(f'{self.title} ({self._head_str})')
             else:
-                self._str_title.set('%s (%.1f %%)' % (self.title, self.percent))
+                self._str_title.set(f'{self.title} ({self._percent:.1f} %)')
         except (TypeError, ZeroDivisionError):
             self._set_arrow(0.0)
             self.can.configure(bg=Colors.NA)
-            self._str_title.set('%s (%s)' % (self.title, 'n/a'))
+            self._str_title.set(f'{self.title} (n/a)')
 
     def _set_arrow(self, ratio: float):
         # normalize ratio : 0.2 to 0.8
@@ -738,54 +1076,246 @@ class GaugeTile(Tile):
 
 
 class ImageRawTile(Tile):
+    NA_FONT_PATH = '/usr/share/fonts/truetype/freefont/FreeMono.ttf'
+    NA_FONT_SIZE = 24
+    # max number of decoded images kept by each tile
+    IMG_CACHE_SIZE = 16
+    # 'n/a' font and decode task are shared by all instances (load on first use)
+    _na_font = None
+    _decode_task = None
+
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        # private
+        self._na_tk_img_d = dict()
+        self._img_cache = OrderedDict()
+        self._img_photo = None
+        self._img_photo_fmt = None
+        self._widget_size = (1, 1)
+        self._load_key = None
+        self._disp_key = None
+        self._last_load = None
+        self._decode_done = queue.Queue()
+        self._decode_pending = 0
         # tk widget init
         self.tk_img = tk.PhotoImage()
         self.lbl_img = tk.Label(self, bg=self.cget('bg'))
         self.lbl_img.pack(expand=True)
+        # track widget size
+        self.bind('<Configure>', self._on_configure)
+
+    @classmethod
+    def _get_na_font(cls) -> PIL.ImageFont.FreeTypeFont:
+        if cls._na_font is None:
+            cls._na_font = PIL.ImageFont.truetype(cls.NA_FONT_PATH, cls.NA_FONT_SIZE)
+        return cls._na_font
+
+    @classmethod
+    def _get_decode_task(cls) -> 'ImageDecodeTask':
+        if ImageRawTile._decode_task is None:
+            ImageRawTile._decode_task = ImageDecodeTask()
+        return ImageRawTile._decode_task
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _build_na_img(cls, size: tuple) -> PIL.Image.Image:
+        # create a replace 'n/a' image (shared by all tiles of the same size)
+        txt = 'n/a'
+        font = cls._get_na_font()
+        left, top, right, bottom = font.getbbox(txt)
+        x = (size[0] - (right - left)) / 2
+        y = (size[1] - (bottom - top)) / 2
+        pil_img = PIL.Image.new('RGB', size, Colors.PINK)
+        PIL.ImageDraw.Draw(pil_img).text((x, y), txt, fill='black', font=font)
+        return pil_img
+
+    @staticmethod
+    def raw_to_pil(img: bytes, size: tuple, crop: tuple = None) -> PIL.Image.Image:
+        # RAW img data to Pillow (PIL) image
+        pil_img = PIL.Image.open(io.BytesIO(img))
+        # let JPEG decoder downscale at DCT level (no-op for other formats)
+        # skip it on crop, as crop box is define in source image coordinates
+        if crop is None:
+            pil_img.draft('RGB', size)
+        # apply crop (by default do nothing)
+        pil_img = pil_img.crop(crop)
+        # force image size to widget size (bilinear is cheaper than default lanczos on small boards)
+        pil_img.thumbnail(size, resample=PIL.Image.BILINEAR)
+        # convert to a tk native mode now (avoid a pixels conversion at PhotoImage build/paste in tk thread)
+        if pil_img.mode not in ('1', 'L', 'RGB', 'RGBA'):
+            with_alpha = pil_img.mode in ('LA', 'PA', 'RGBa') or 'transparency' in pil_img.info
+            pil_img = pil_img.convert('RGBA' if with_alpha else 'RGB')
+        return pil_img
+
+    @property
+    def widget_size(self) -> tuple:
+        return self._widget_size
+
+    def _on_configure(self, evt):
+        # keep widget size up to date (avoid winfo_width/height queries for each image)
+        widget_size = (evt.width, evt.height)
+        if widget_size != self._widget_size:
+            self._widget_size = widget_size
+            # cached images of previous size are now useless
+            self._na_tk_img_d.clear()
+            self._img_cache.clear()
+            self._disp_key = None
+            # reload the last image at new size
+            if self._last_load is not None:
+                img, crop = self._last_load
+                self._last_load = None
+                self.load(img, crop)
+
+    def _img_cache_key(self, img: bytes, crop: tuple = None) -> tuple:
+        return hashlib.blake2b(img, digest_size=16).digest(), self.widget_size, crop
+
+    def _img_cache_get(self, key: tuple) -> PIL.Image.Image:
+        # return a decoded image (or None if not in cache)
+        pil_img = self._img_cache.get(key)
+        if pil_img is not None:
+            self._img_cache.move_to_end(key)
+        return pil_img
+
+    def _img_cache_put(self, key: tuple, pil_img: PIL.Image.Image) -> None:
+        # add a decoded image, drop the least recently used one if cache is full
+        self._img_cache[key] = pil_img
+        self._img_cache.move_to_end(key)
+        while len(self._img_cache) > self.IMG_CACHE_SIZE:
+            self._img_cache.popitem(last=False)
 
     def load(self, img: bytes, crop: tuple = None) -> None:
+        # tags return the same bytes object until IO thread read a new one: skip it without any hash
+        if self._last_load is not None and self._last_load[0] is img and self._last_load[1] == crop:
+            return
+        self._last_load = (img, crop)
         # enforce type
         try:
             img = bytes(img)
         except (TypeError, ValueError):
             img = None
-        # display current image or 'n/a' 
+        # display current image or 'n/a'
         try:
-            widget_size = (self.winfo_width(), self.winfo_height())
             if img:
-                # RAW img data to Pillow (PIL) image
-                pil_img = PIL.Image.open(io.BytesIO(img))
-                # apply crop (by default do nothing)
-                pil_img = pil_img.crop(crop)
-                # force image size to widget size
-                pil_img.thumbnail(widget_size)
+                # decode image in the decode task thread (if not already done), tk thread only build the PhotoImage
+                key = self._img_cache_key(img, crop)
+                self._load_key = key
+                # same content as the displayed image (new bytes object read from DB)
+                if key == self._disp_key:
+                    return
+                pil_img = self._img_cache_get(key)
+                if pil_img is not None:
+                    self.display(pil_img)
+                    self._disp_key = key
+                elif self._get_decode_task().add((self._decode_done, key, img, self.widget_size, crop)):
+                    self._decode_pending += 1
+                    # start polling results (if not already running)
+                    if self._decode_pending == 1:
+                        self.after(50, self._poll_decode)
+                else:
+                    # decode queue is full: decode it here
+                    pil_img = self.raw_to_pil(img, self.widget_size, crop)
+                    self._img_cache_put(key, pil_img)
+                    self.display(pil_img)
+                    self._disp_key = key
             else:
-                # create a replace 'n/a' image
-                pil_img = PIL.Image.new('RGB', widget_size, Colors.PINK)
-                txt = 'n/a'
-                draw = PIL.ImageDraw.Draw(pil_img)
-                font = PIL.ImageFont.truetype('/usr/share/fonts/truetype/freefont/FreeMono.ttf', 24)
-                left, top, right, bottom = draw.textbbox((0, 0), txt, font=font)
-                x = (widget_size[0] - (right - left)) / 2
-                y = (widget_size[1] - (bottom - top)) / 2
-                draw.text((x, y), txt, fill='black', font=font)
-            # update image label
-            self.tk_img = PIL.ImageTk.PhotoImage(pil_img)
-            self.lbl_img.configure(image=self.tk_img)
+                self._load_key = None
+                self._disp_key = None
+                self.display(None)
+        except Exception:
+            logging.error(traceback.format_exc())
+
+    def _poll_decode(self) -> None:
+        # display decoded images, poll again while some jobs are pending
+        try:
+            while True:
+                key, pil_img = self._decode_done.get_nowait()
+                self._decode_pending -= 1
+                if pil_img is not None:
+                    self._img_cache_put(key, pil_img)
+                # skip outdated results (another image was load since this one was queued)
+                if key == self._load_key:
+                    self.display(pil_img)
+                    self._disp_key = key if pil_img is not None else None
+        except queue.Empty:
+            pass
         except Exception:
             logging.error(traceback.format_exc())
+        if self._decode_pending > 0:
+            self.after(50, self._poll_decode)
+
+    def display(self, pil_img: PIL.Image.Image = None) -> None:
+        # update image label with a PIL image or with 'n/a' image if pil_img is None (call it from tk thread only)
+        if pil_img:
+            # reuse current tk image if mode and size match (paste avoid a new tk image allocation)
+            img_fmt = (pil_img.mode, pil_img.size)
+            if self._img_photo is not None and self._img_photo_fmt == img_fmt:
+                self._img_photo.paste(pil_img)
+            else:
+                self._img_photo = PIL.ImageTk.PhotoImage(pil_img)
+                self._img_photo_fmt = img_fmt
+            tk_img = self._img_photo
+        else:
+            # 'n/a' image: build it only once for a given widget size
+            widget_size = self.widget_size
+            if widget_size not in self._na_tk_img_d:
+                self._na_tk_img_d[widget_size] = PIL.ImageTk.PhotoImage(self._build_na_img(widget_size))
+            tk_img = self._na_tk_img_d[widget_size]
+        # a pasted image is redrawn by tk, only reconfigure label on image change
+        if tk_img is not self.tk_img:
+            self.tk_img = tk_img
+            self.lbl_img.configure(image=self.tk_img)
+
+
+class ImageDecodeTask(AsyncTask):
+    """ Decode RAW images to PIL images in a separate thread, results are push to the queue given with each item. """
+
+    def __init__(self, max_items: int = 32, workers: int = 2) -> None:
+        # PIL release the GIL during decode/resize: 2 workers can process 2 images (like cams) in parallel
+        AsyncTask.__init__(self, max_items=max_items, workers=workers)
+
+    def do(self, item: tuple) -> None:
+        # item is a (done_queue, key, img, size, crop) tuple, push (key, PIL image) or (key, None) on decode error
+        done_queue, key, img, size, crop = item
+        try:
+            pil_img = ImageRawTile.raw_to_pil(img, size, crop)
+        except Exception as e:
+            logging.warning(f'except {type(e).__name__} in {type(self).__name__}: {e}')
+            pil_img = None
+        done_queue.put((key, pil_img))
+
+
+class ImageReadTask(AsyncTask):
+    """ Read RAW images (like redis hget) in a separate thread, results are push to the queue given with each item. """
+
+    def do(self, item: tuple) -> None:
+        # item is a (done_queue, name, read) tuple, push (name, raw image) or (name, None) on read error
+        done_queue, name, read = item
+        try:
+            raw = read(name)
+        except Exception as e:
+            logging.warning(f'except {type(e).__name__} in {type(self).__name__}: {e}')
+            raw = None
+        done_queue.put((name, raw))
 
 
 class ImageRawCarouselTile(ImageRawTile):
-    def __init__(self, *args, raw_img_tag_d: Tag, update_ms: int = 20_000, **kwargs):
+    # read task is shared by all instances (load on first use)
+    _read_task = None
+
+    def __init__(self, *args, names_tag: Tag, raw_read: Callable, update_ms: int = 20_000, **kwargs):
         ImageRawTile.__init__(self, *args, **kwargs)
         # public
-        self.raw_img_tag_d = raw_img_tag_d
+        self.names_tag = names_tag
+        self.raw_read = raw_read
         # private
-        self._playlist = []
+        self._read_name = None
+        self._read_done = queue.Queue()
+        self._read_pending = 0
+        self._playlist = deque()
+        self._img_names = frozenset()
+        self._img_names_sorted = []
         self._skip_n_cycle = 0
+        self._click_after_id = None
         # bind function for skip update
         self.bind('<Button-1>', self._on_click)
         self.lbl_img.bind('<Button-1>', self._on_click)
@@ -796,6 +1326,9 @@ class ImageRawCarouselTile(ImageRawTile):
             self.init_cyclic_update(every_ms=update_ms)
 
     def update(self):
+        # nothing to do if the tile is not currently displayed (like in an unselected tab)
+        if not self.winfo_viewable():
+            return
         # display next image or skip this if skip counter is set
         if self._skip_n_cycle > 0:
             self._skip_n_cycle -= 1
@@ -806,28 +1339,66 @@ class ImageRawCarouselTile(ImageRawTile):
         # try to load next valid image
         while True:
             try:
-                img_name = self._playlist.pop(0)
-                self.load(self.raw_img_tag_d.get(img_name))
+                img_name = self._playlist.popleft()
+                # only the image to display is read from DB, in the read task thread (a slow DB never freeze tk)
+                self._read_name = img_name
+                if self._get_read_task().add((self._read_done, img_name, self.raw_read)):
+                    self._read_pending += 1
+                    # start polling results (if not already running)
+                    if self._read_pending == 1:
+                        self.after(50, self._poll_read)
                 break
             except IndexError:
-                # refill playlist
+                # refill playlist (image names are read once by playlist cycle)
                 try:
-                    self._playlist = list(dict(self.raw_img_tag_d.get()).keys())
-                    self._playlist.sort()
+                    img_names = frozenset(self.names_tag.get())
+                    # sort names only when the set of images change
+                    if img_names != self._img_names:
+                        self._img_names = img_names
+                        self._img_names_sorted = sorted(img_names)
+                    self._playlist = deque(self._img_names_sorted)
                     # test empty list
                     if not self._playlist:
                         raise ValueError
                 except (TypeError, ValueError):
-                    self.raw_display = None
+                    self.load(None)
                     break
 
+    @classmethod
+    def _get_read_task(cls) -> ImageReadTask:
+        if ImageRawCarouselTile._read_task is None:
+            ImageRawCarouselTile._read_task = ImageReadTask()
+        return ImageRawCarouselTile._read_task
+
+    def _poll_read(self) -> None:
+        # load read images, poll again while some reads are pending
+        try:
+            while True:
+                name, raw = self._read_done.get_nowait()
+                self._read_pending -= 1
+                # skip outdated results (another image was requested since this one)
+                if name == self._read_name:
+                    self.load(raw)
+        except queue.Empty:
+            pass
+        except Exception:
+            logging.error(traceback.format_exc())
+        if self._read_pending > 0:
+            self.after(50, self._poll_read)
+
     def _on_click(self, _evt):
         # on first click: skip the 8 next auto update cycle
-        # on second one: also load the next image
+        # on second one: also load the next image (debounced, a click burst load only one image)
         if self._skip_n_cycle > 0:
-            self._load_next_img()
+            if self._click_after_id:
+                self.after_cancel(self._click_after_id)
+            self._click_after_id = self.after(150, self._on_click_load)
         self._skip_n_cycle = 8
 
+    def _on_click_load(self):
+        self._click_after_id = None
+        self._load_next_img()
+
 
 class MessageTile(Tile):
     def __init__(self, *args, **kwargs):
@@ -836,11 +1407,13 @@ class MessageTile(Tile):
         self.tk_str_msg = tk.StringVar()
         # tk stuff
         tk.Label(self, textvariable=self.tk_str_msg, bg=self.cget('bg'),
-                 fg=Colors.TXT, font=('courrier', 20, 'bold')).pack(expand=True)
+                 fg=Colors.TXT, font=shared_font(('courrier', 20, 'bold'))).pack(expand=True)
 
 
 class NewsBannerTile(Tile):
     BAN_MAX_NB_CHAR = 50
+    # max number of titles lists with scroll views kept in cache
+    FRAMES_CACHE_SIZE = 4
 
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
@@ -848,20 +1421,28 @@ class NewsBannerTile(Tile):
         self.ban_nb_char = NewsBannerTile.BAN_MAX_NB_CHAR
         # private
         self._titles_l = []
+        self._last_payload = []
+        self._frames_cache = OrderedDict()
         self._lbl_ban = tk.StringVar()
-        self._next_ban_str = ''
-        self._disp_ban_str = ''
+        self._next_ban_frames = ()
+        self._disp_ban_frames = ()
         self._disp_ban_pos = 0
+        self._disp_ban_view = None
         # tk stuff
         # set background for this tile
         self.configure(bg=Colors.NEWS_BG)
         # use a proportional font to handle spaces correctly, height is nb of lines
         tk.Label(self, textvariable=self._lbl_ban, height=1,
-                 bg=self.cget('bg'), fg=Colors.NEWS_TXT, font=('courier', 51, 'bold')).pack(expand=True)
-        # auto-update banner every 200ms
+                 bg=self.cget('bg'), fg=Colors.NEWS_TXT,
+                 font=shared_font(('courier', 51, 'bold'))).pack(expand=True)
+        # auto-update banner every 200ms (the app pause()/resume() it on notebook tab change)
         self.init_cyclic_update(every_ms=200)
 
     def load(self, titles_l: List[str]) -> None:
+        # skip type enforce (and its list copy) if payload is the same as the previous one
+        if titles_l == self._last_payload:
+            return
+        self._last_payload = titles_l
         # enforce type
         try:
             titles_l = list(titles_l)
@@ -875,33 +1456,66 @@ class NewsBannerTile(Tile):
     def update(self):
         # scroll text on screen
         # start a new scroll ?
-        if self._disp_ban_pos >= len(self._disp_ban_str) - self.ban_nb_char:
-            # update display scroll message
-            self._disp_ban_str = self._next_ban_str
+        if self._disp_ban_pos >= len(self._disp_ban_frames):
+            # update display scroll frames
+            self._disp_ban_frames = self._next_ban_frames
             self._disp_ban_pos = 0
-        scroll_view = self._disp_ban_str[self._disp_ban_pos:self._disp_ban_pos + self.ban_nb_char]
-        self._lbl_ban.set(scroll_view)
+            if not self._disp_ban_frames:
+                return
+        scroll_view = self._disp_ban_frames[self._disp_ban_pos]
+        # avoid tk redraw if view is unchanged (like on blank head)
+        if scroll_view != self._disp_ban_view:
+            self._disp_ban_view = scroll_view
+            self._lbl_ban.set(scroll_view)
         self._disp_ban_pos += 1
 
+    def pause(self):
+        # stop scrolling
+        if self._update_after_id:
+            self.after_cancel(self._update_after_id)
+            self._update_after_id = None
+
+    def resume(self):
+        # restart scrolling (if paused)
+        if self._update_after_id is None:
+            self.init_cyclic_update(every_ms=self._update_every_ms)
+
     def _on_data_change(self):
+        # reuse scroll views of a recently seen titles list (key include banner width)
+        try:
+            key = (tuple(self._titles_l), self.ban_nb_char)
+            frames = self._frames_cache.get(key)
+        except TypeError:
+            key, frames = None, None
+        if frames is not None:
+            self._frames_cache.move_to_end(key)
+            self._next_ban_frames = frames
+            return
         spaces_head = ' ' * self.ban_nb_char
         try:
-            # update banner
-            self._next_ban_str = spaces_head
-            for title in self._titles_l:
-                self._next_ban_str += title + spaces_head
+            # update banner (titles separated by spaces head, build with a single join)
+            next_ban_str = spaces_head + ''.join(title + spaces_head for title in self._titles_l)
         except TypeError:
-            self._next_ban_str = spaces_head + 'n/a' + spaces_head
+            next_ban_str = spaces_head + 'n/a' + spaces_head
         except Exception:
-            self._next_ban_str = spaces_head + 'n/a' + spaces_head
+            next_ban_str = spaces_head + 'n/a' + spaces_head
             logging.error(traceback.format_exc())
+        # precompute all scroll views once
+        self._next_ban_frames = tuple(next_ban_str[pos:pos + self.ban_nb_char]
+                                      for pos in range(len(next_ban_str) - self.ban_nb_char))
+        # add them to cache, drop the least recently used entry if cache is full
+        if key is not None:
+            self._frames_cache[key] = self._next_ban_frames
+            while len(self._frames_cache) > self.FRAMES_CACHE_SIZE:
+                self._frames_cache.popitem(last=False)
 
 
 class VigilanceTile(Tile):
-    VIG_COLOR_STR = ['n/a', 'verte', 'jaune', 'orange', 'rouge']
-    VIG_COLOR = [Colors.NA, Colors.GREEN, Colors.YELLOW, Colors.ORANGE, Colors.RED]
-    ID_RISK = ['n/a', 'vent', 'pluie', 'orages', 'crues', 'neige/verglas',
-               'canicule', 'grand froid', 'avalanches', 'submersion']
+    # (level str, tile color) for each vigilance level
+    VIG_LEVEL = (('N/A', Colors.NA), ('VERTE', Colors.GREEN), ('JAUNE', Colors.YELLOW),
+                 ('ORANGE', Colors.ORANGE), ('ROUGE', Colors.RED))
+    ID_RISK = ('n/a', 'vent', 'pluie', 'orages', 'crues', 'neige/verglas',
+               'canicule', 'grand froid', 'avalanches', 'submersion')
 
     def __init__(self, *args, department='', **kwargs):
         Tile.__init__(self, *args, **kwargs)
@@ -910,15 +1524,23 @@ class VigilanceTile(Tile):
         # private
         self._vig_level = None
         self._risk_ids = None
-        self._level_str = tk.StringVar()
-        self._risk_str = tk.StringVar()
+        self._level_str = None
+        self._risk_str = None
+        self._tile_color = Colors.NA
         # tk job
         self.configure(bg=Colors.NA)
-        tk.Label(self, text='Vigilance', font='bold', bg=Colors.NA, fg=Colors.TXT).pack()
-        tk.Label(self, text=self.department, font='bold', bg=Colors.NA, fg=Colors.TXT).pack()
-        tk.Label(self, font=('', 2), bg=Colors.NA, fg=Colors.TXT).pack()
-        tk.Label(self, textvariable=self._level_str, font='bold', bg=Colors.NA, fg=Colors.TXT).pack()
-        tk.Label(self, textvariable=self._risk_str, font=('', 8), bg=Colors.NA, fg=Colors.TXT).pack()
+        # keep a reference to all widgets with a background to update
+        self._bg_widgets = [
+            self,
+            tk.Label(self, text='Vigilance', font=shared_font('bold'), bg=Colors.NA, fg=Colors.TXT),
+            tk.Label(self, text=self.department, font=shared_font('bold'), bg=Colors.NA, fg=Colors.TXT),
+            tk.Label(self, font=shared_font(('', 2)), bg=Colors.NA, fg=Colors.TXT),
+            tk.Label(self, font=shared_font('bold'), bg=Colors.NA, fg=Colors.TXT),
+            tk.Label(self, font=shared_font(('', 8)), bg=Colors.NA, fg=Colors.TXT),
+        ]
+        self._level_lbl, self._risk_lbl = self._bg_widgets[4:]
+        for w in self._bg_widgets[1:]:
+            w.pack()
         # init widget with first call to _on_change()
         self._on_change()
 
@@ -938,103 +1560,145 @@ class VigilanceTile(Tile):
             self._risk_ids = risk_id_l
             self._on_change()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _compose(vig_level: int, risk_ids: tuple) -> tuple:
+        # return (level_str, tile_color, risk_str) for a vigilance level and its risks ids
+        # color of tile and color str
+        if isinstance(vig_level, int) and 0 <= vig_level < len(VigilanceTile.VIG_LEVEL):
+            level_str, tile_color = VigilanceTile.VIG_LEVEL[vig_level]
+        else:
+            level_str, tile_color = 'n/a', Colors.NA
+        # risks str
+        if risk_ids is not None and all(isinstance(i, int) and 0 <= i < len(VigilanceTile.ID_RISK)
+                                        for i in risk_ids[:2]):
+            risk_str = ' ' + ''.join(VigilanceTile.ID_RISK[i] + ' ' for i in risk_ids[:2])
+        else:
+            risk_str = 'n/a'
+        return level_str, tile_color, risk_str
+
     def _on_change(self):
-        # update color of tile and color str
-        try:
-            level_str = VigilanceTile.VIG_COLOR_STR[self._vig_level].upper()
-            tile_color = VigilanceTile.VIG_COLOR[self._vig_level]
-        except (IndexError, TypeError):
-            level_str = 'n/a'
-            tile_color = Colors.NA
-        # apply to tk
-        self._level_str.set(level_str)
-        for w in self.winfo_children():
-            w.configure(bg=tile_color)
-        self.configure(bg=tile_color)
-        # add risks str
+        # build strings and color (cached for already seen level and risks)
+        risk_ids = None if self._risk_ids is None else tuple(self._risk_ids[:2])
         try:
-            str_risk = ' '
-            for id_risk in self._risk_ids[:2]:
-                str_risk += VigilanceTile.ID_RISK[id_risk] + ' '
-        except (IndexError, TypeError):
-            str_risk = 'n/a'
-        # apply to tk
-        self._risk_str.set(f'{str_risk}')
+            level_str, tile_color, risk_str = self._compose(self._vig_level, risk_ids)
+        except TypeError:
+            # unhashable risk id(s)
+            level_str, tile_color, risk_str = self._compose(self._vig_level, None)
+        # apply to tk (configure labels directly, only on text change)
+        if level_str != self._level_str:
+            self._level_str = level_str
+            self._level_lbl.configure(text=level_str)
+        if tile_color != self._tile_color:
+            self._tile_color = tile_color
+            # recolor all widgets (only on color change)
+            for w in self._bg_widgets:
+                w.configure(bg=tile_color)
+        if risk_str != self._risk_str:
+            self._risk_str = risk_str
+            self._risk_lbl.configure(text=risk_str)
 
 
 class WattsTile(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # public
         # private
         self._pwr = None
         self._today_wh = None
         self._yesterday_wh = None
-        self._pwr_text = tk.StringVar()
-        self._tdy_text = tk.StringVar()
-        self._ydy_text = tk.StringVar()
+        self._last_texts = dict()
+        self._last_payload = None
         # tk job
-        tk.Label(self, text='Loos Watts news', bg=self.cget('bg'), fg=Colors.TXT,
-                 font=('courier', 14, 'bold', 'underline')).pack()
-        tk.Label(self, textvariable=self._pwr_text, bg=self.cget('bg'), fg=Colors.TXT,
-                 font=('courier', 14, 'bold')).pack(expand=True)
-        tk.Label(self, textvariable=self._tdy_text, bg=self.cget('bg'), fg=Colors.TXT,
-                 font=('courier', 14, 'bold')).pack(expand=True)
-        tk.Label(self, textvariable=self._ydy_text, bg=self.cget('bg'), fg=Colors.TXT,
-                 font=('courier', 14, 'bold')).pack(expand=True)
+        tk.Label(self, text='Loos Watts news', bg=bg, fg=Colors.TXT,
+                 font=shared_font(('courier', 14, 'bold', 'underline'))).pack()
+        self._pwr_lbl = tk.Label(self, text=f'  P {"n/a":>5} w  ', bg=bg, fg=Colors.TXT,
+                                 font=shared_font(('courier', 14, 'bold')))
+        self._pwr_lbl.pack(expand=True)
+        self._tdy_lbl = tk.Label(self, text=f'  J {"n/a":>5} kwh', bg=bg, fg=Colors.TXT,
+                                 font=shared_font(('courier', 14, 'bold')))
+        self._tdy_lbl.pack(expand=True)
+        self._ydy_lbl = tk.Label(self, text=f'J-1 {"n/a":>5} kwh', bg=bg, fg=Colors.TXT,
+                                 font=shared_font(('courier', 14, 'bold')))
+        self._ydy_lbl.pack(expand=True)
 
     def load(self, pwr: float, today_wh: float, yesterday_wh: float) -> None:
+        # skip all the job if payload is the same as the previous one
+        payload = (pwr, today_wh, yesterday_wh)
+        if payload == self._last_payload:
+            return
+        self._last_payload = payload
         # enforce type
         try:
-            self._pwr = float(pwr)
+            pwr = float(pwr)
         except (TypeError, ValueError):
-            self._pwr = None
+            pwr = None
         try:
-            self._today_wh = float(today_wh)
+            today_wh = float(today_wh)
         except (TypeError, ValueError):
-            self._today_wh = None        
+            today_wh = None
         try:
-            self._yesterday_wh = float(yesterday_wh)
+            yesterday_wh = float(yesterday_wh)
         except (TypeError, ValueError):
-            self._yesterday_wh = None
-        # update widget
-        self._pwr_text.set('  P %5s w  ' % ('n/a' if self._pwr is None else self._pwr))
-        self._tdy_text.set('  J %5s kwh' % ('n/a' if self._today_wh is None else round(self._today_wh / 1000)))
-        self._ydy_text.set('J-1 %5s kwh' % ('n/a' if self._yesterday_wh is None else round(self._yesterday_wh / 1000)))
+            yesterday_wh = None
+        # on change -> update widget (compare formatted texts: a kwh value rarely change at display precision)
+        if self._pwr != pwr:
+            self._pwr = pwr
+            pwr_str = 'n/a' if self._pwr is None else self._pwr
+            self._set_text(self._pwr_lbl, f'  P {pwr_str:>5} w  ')
+        if self._today_wh != today_wh:
+            self._today_wh = today_wh
+            tdy_str = 'n/a' if self._today_wh is None else round(self._today_wh / 1000)
+            self._set_text(self._tdy_lbl, f'  J {tdy_str:>5} kwh')
+        if self._yesterday_wh != yesterday_wh:
+            self._yesterday_wh = yesterday_wh
+            ydy_str = 'n/a' if self._yesterday_wh is None else round(self._yesterday_wh / 1000)
+            self._set_text(self._ydy_lbl, f'J-1 {ydy_str:>5} kwh')
+
+    def _set_text(self, label: tk.Label, text: str) -> None:
+        # avoid a label configure (and redraw) if text is unchanged
+        if self._last_texts.get(label) != text:
+            self._last_texts[label] = text
+            label.configure(text=text)
 
 
 class WeatherTile(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
+        bg = self.cget('bg')
         # public
         # private
         self._w_today_dict = None
         self._w_forecast_dict = None
         self._days_f_l = list()
         self._days_lbl = list()
+        # last texts set on days widgets (avoid useless tk configure)
+        self._days_f_txt = ['n/a'] * 4
+        self._days_lbl_txt = ['n/a'] * 4
         # tk stuff
-        # build 4x3 grid
+        # build 4x3 grid (uniform groups size cells equally, without placeholder widgets)
+        for r in range(3):
+            self.grid_rowconfigure(r, weight=1, uniform='weather_rows')
         for c in range(4):
-            for r in range(3):
-                self.grid_rowconfigure(r, weight=1)
-                tk.Label(self, pady=0, padx=0).grid(column=c, row=r)
-            self.grid_columnconfigure(c, weight=1)
+            self.grid_columnconfigure(c, weight=1, uniform='weather_cols')
             # creation
             self._days_f_l.append(
-                tk.LabelFrame(self, text='n/a', bg=self.cget('bg'), fg=Colors.TXT,
-                              font=('bold', 10)))
+                tk.LabelFrame(self, text='n/a', bg=bg, fg=Colors.TXT,
+                              font=shared_font(('bold', 10))))
             self._days_lbl.append(
-                tk.Label(self._days_f_l[c], text='n/a', bg=self.cget('bg'), fg=Colors.TXT,
-                         font='bold', anchor=tk.W, justify=tk.LEFT))
+                tk.Label(self._days_f_l[c], text='n/a', bg=bg, fg=Colors.TXT,
+                         font=shared_font('bold'), anchor=tk.W, justify=tk.LEFT))
             # impression
             self._days_f_l[c].grid(row=2, column=c, sticky=tk.NSEW)
             self._days_f_l[c].grid_propagate(False)
             self._days_lbl[c].grid(sticky=tk.NSEW)
             self._days_lbl[c].grid_propagate(False)
         # today frame
-        self.frm_today = tk.LabelFrame(self, bg=self.cget('bg'), fg=Colors.TXT, text='n/a', font=('bold', 18))
-        self.lbl_today = tk.Label(self.frm_today, text='n/a', bg=self.cget('bg'), fg=Colors.TXT,
-                                  font=('courier', 18, 'bold'), anchor=tk.W, justify=tk.LEFT)
+        self.frm_today = tk.LabelFrame(self, bg=bg, fg=Colors.TXT, text='n/a',
+                                       font=shared_font(('bold', 18)))
+        self.lbl_today = tk.Label(self.frm_today, text='n/a', bg=bg, fg=Colors.TXT,
+                                  font=shared_font(('courier', 18, 'bold')), anchor=tk.W, justify=tk.LEFT)
         self.frm_today.grid(row=0, column=0, columnspan=4, rowspan=2, sticky=tk.NSEW)
         self.frm_today.grid_propagate(False)
         self.lbl_today.grid(column=0)
@@ -1060,7 +1724,7 @@ class WeatherTile(Tile):
 
     def _on_today_change(self):
         # set today frame label
-        self.frm_today.configure(text=datetime.now().date().strftime('%d/%m/%Y'))
+        self.frm_today.configure(text=date.today().strftime('%d/%m/%Y'))
         # fill labels
         if self._w_today_dict:
             try:
@@ -1088,10 +1752,11 @@ class WeatherTile(Tile):
             self.lbl_today.configure(text='n/a')
 
     def _on_forecast_change(self):
-        # set forecast frames labels
+        # set forecast frames labels (read current date once)
+        today = date.today()
         for i in range(4):
-            dt = datetime.now().date() + timedelta(days=i + 1)
-            self._days_f_l[i].configure(text=dt.strftime('%d/%m/%Y'))
+            dt = today + timedelta(days=i + 1)
+            self._set_day_frame(i, dt.strftime('%d/%m/%Y'))
         # refresh forecast labels with new data if availables (or error msg if not)
         if self._w_forecast_dict:
             try:
@@ -1102,19 +1767,34 @@ class WeatherTile(Tile):
                     day_t_min = self._w_forecast_dict[d]['t_min']
                     day_t_max = self._w_forecast_dict[d]['t_max']
                     msg = f'{day_desr}\n\nT min {day_t_min:.0f}°C\nT max {day_t_max:.0f}°C'
-                    self._days_lbl[i].configure(text=msg)
+                    self._set_day_label(i, msg)
             except Exception:
                 logging.error(traceback.format_exc())
                 # update days labels to 'n/a' error message
                 for i in range(4):
-                    self._days_lbl[i].configure(text='error')
+                    self._set_day_label(i, 'error')
         else:
             # update days labels to 'n/a' error message
             for i in range(4):
-                self._days_lbl[i].configure(text='n/a')
+                self._set_day_label(i, 'n/a')
+
+    def _set_day_frame(self, idx: int, text: str) -> None:
+        # update day frame text only on change
+        if self._days_f_txt[idx] != text:
+            self._days_f_txt[idx] = text
+            self._days_f_l[idx].configure(text=text)
+
+    def _set_day_label(self, idx: int, text: str) -> None:
+        # update day label text only on change
+        if self._days_lbl_txt[idx] != text:
+            self._days_lbl_txt[idx] = text
+            self._days_lbl[idx].configure(text=text)
 
 
 class PdfLauncherTile(Tile):
+    # xpdf command line: one argv item by option/value (geometry and file path are add at click time)
+    XPDF_ARGV = ('/usr/bin/xpdf', '-z', 'page', '-cont', '-geometry')
+
     def __init__(self, *args, file, raw_tag, **kwargs):
         Tile.__init__(self, *args, **kwargs)
         # public
@@ -1123,43 +1803,98 @@ class PdfLauncherTile(Tile):
         # private
         self._front_name = os.path.splitext(self.file)[0].strip()
         self._ps_l = list()
+        self._ps_lock = threading.Lock()
+        self._pdf_fd = None
+        self._pdf_hash = None
+        self._spawn_id = 0
         # tk stuff
         self._name_lbl = tk.Label(self, text=self._front_name, wraplength=550,
-                                  bg=self.cget('bg'), fg=Colors.TXT, font=('courrier', 20, 'bold'))
+                                  bg=self.cget('bg'), fg=Colors.TXT, font=shared_font(('courrier', 20, 'bold')))
         self._name_lbl.pack(expand=True)
         # bind function for open pdf file
         self.bind('<Button-1>', self._on_click)
         self._name_lbl.bind('<Button-1>', self._on_click)
-        self.bind('<Destroy>', self._on_unmap)
+        self.bind('<Destroy>', self._on_destroy)
         self.bind('<Unmap>', self._on_unmap)
 
     def _on_click(self, _evt):
         try:
-            # build a temp file with RAW pdf data from redis hash
+            # build an in-memory file (no disk write) with RAW pdf data from redis hash
             raw_data = self.raw_tag.get(args={'file': self.file})
             if raw_data:
-                tmp_f = tempfile.NamedTemporaryFile(prefix='board-', suffix='.pdf', delete=True)
-                tmp_f.write(raw_data)
-                # open it with xpdf
-                xpdf_geometry = '-geometry %sx%s' % (self.master.winfo_width(), self.master.winfo_height() - 10)
-                ps = subprocess.Popen(['/usr/bin/xpdf', xpdf_geometry, '-z page', '-cont', tmp_f.name],
-                                      stdin=subprocess.DEVNULL,
-                                      stdout=subprocess.DEVNULL,
-                                      stderr=subprocess.DEVNULL,
-                                      close_fds=True)
-                # keep process references for _on_unmap() job
-                self._ps_l.append(ps)
-                # remove temp file after xpdf startup
-                self.after(ms=1000, func=tmp_f.close)
+                # one memory file by PDF content: on change, write a new one (never rewrite a file an xpdf may read)
+                # the old one can be close now, running xpdf and pending spawns have their own fd on it
+                pdf_hash = hashlib.blake2b(raw_data, digest_size=16).digest()
+                if self._pdf_fd is None or pdf_hash != self._pdf_hash:
+                    pdf_fd = os.memfd_create('board-pdf', os.MFD_CLOEXEC)
+                    try:
+                        os.write(pdf_fd, raw_data)
+                    except OSError:
+                        os.close(pdf_fd)
+                        raise
+                    if self._pdf_fd is not None:
+                        os.close(self._pdf_fd)
+                    self._pdf_fd = pdf_fd
+                    self._pdf_hash = pdf_hash
+                # open it with xpdf (fd is inherited by xpdf, which read it through /proc)
+                # spawn thread use its own copy of the fd: the tile one can be close by _on_destroy() at any time
+                spawn_fd = os.dup(self._pdf_fd)
+                xpdf_geometry = f'{self.master.winfo_width()}x{self.master.winfo_height() - 10}'
+                cmd = [*self.XPDF_ARGV, xpdf_geometry, f'/proc/self/fd/{spawn_fd}']
+                # fork/exec is slow on small boards: do it in a separate thread to keep tk thread responsive
+                threading.Thread(target=self._spawn_xpdf, args=(cmd, spawn_fd, self._spawn_id),
+                                 daemon=True).start()
         except Exception:
             logging.error(traceback.format_exc())
 
+    def _spawn_xpdf(self, cmd: List[str], pdf_fd: int, spawn_id: int) -> None:
+        # run by a spawn thread (not by tk thread), pdf_fd is owned by this thread
+        try:
+            ps = subprocess.Popen(cmd,
+                                  stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL,
+                                  close_fds=True, pass_fds=(pdf_fd,))
+        except Exception:
+            logging.error(traceback.format_exc())
+            return
+        finally:
+            os.close(pdf_fd)
+        # keep process reference for _on_unmap() job (check and append are atomic with _on_unmap())
+        with self._ps_lock:
+            outdated = spawn_id != self._spawn_id
+            if not outdated:
+                self._ps_l.append(ps)
+        # tab was exit during spawn: close xpdf now
+        if outdated:
+            ps.terminate()
+            self._reap_ps([ps])
+
+    def _on_destroy(self, evt):
+        self._on_unmap(evt)
+        # release memory file
+        if self._pdf_fd is not None:
+            os.close(self._pdf_fd)
+            self._pdf_fd = None
+            self._pdf_hash = None
+
     def _on_unmap(self, _evt):
+        # xpdf spawn in progress are now outdated
+        with self._ps_lock:
+            self._spawn_id += 1
+            ps_l, self._ps_l = self._ps_l, list()
         # terminate all xpdf process on tab exit
-        # iterate on copy of process list
-        for ps in list(self._ps_l):
-            # terminate (ps wait for zombie process avoid)
-            ps.terminate()
-            ps.wait()
-            # remove ps from original list
-            self._ps_l.remove(ps)
+        if ps_l:
+            for ps in ps_l:
+                ps.terminate()
+            # wait for process end in a separate thread (zombie process avoid) to keep tk thread responsive
+            threading.Thread(target=self._reap_ps, args=(ps_l,), daemon=True).start()
+
+    @staticmethod
+    def _reap_ps(ps_l: List[subprocess.Popen]) -> None:
+        for ps in ps_l:
+            try:
+                ps.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                ps.kill()
+                ps.wait()
@@ -2,11 +2,11 @@
 
 import argparse
 import logging
-from typing import Any
+from typing import Any, List
 import tkinter as tk
 from tkinter import ttk
 from lib.dashboard_ui import \
-    AsyncTask, CustomRedis, Tag, TagsBase, TilesTab, PdfTilesTab, wait_uptime, \
+    AsyncTask, CustomRedis, RedisRead, Tag, TagsBase, TilesTab, PdfTilesTab, dict_path, wait_uptime, \
     AirQualityTile, ClockTile, DaysAccTileLoos, GaugeTile, NewsBannerTile, \
     FlysprayTile, ImageRawTile, ImageRawCarouselTile, VigilanceTile, WattsTile, WeatherTile
 from conf.private_loos import REDIS_USER, REDIS_PASS, REM_REDIS_HOST, REM_REDIS_PORT, REM_REDIS_USER, REM_REDIS_PASS
@@ -24,24 +24,25 @@ class Tags(TagsBase):
     # WARNs: -> all tags with io_every set are manage by an independent (of tk mainloop) IO thread
     #           this thread periodically update tag value and avoid tk GUI loop do this and lose time on DB IO
     #        -> tags callbacks (read/write methods) are call by this IO thread (not by tkinter main thread)
-    D_GSHEET_GRT = Tag(read=lambda: DB.main.get_js('json:gsheet'), io_every=2.0)
-    D_ATMO_QUALITY = Tag(read=lambda: DB.main.get_js('json:atmo'), io_every=2.0)
-    D_W_TODAY_LOOS = Tag(read=lambda: DB.main.get_js('json:weather:today:loos'), io_every=2.0)
-    D_W_FORECAST_LOOS = Tag(read=lambda: DB.main.get_js('json:weather:forecast:loos'), io_every=2.0)
-    D_WEATHER_VIG = Tag(read=lambda: DB.main.get_js('json:vigilance'), io_every=2.0)
-    D_NEWS_LOCAL = Tag(read=lambda: DB.main.get_js('json:news'), io_every=2.0)
-    MET_PWR_ACT = Tag(read=lambda: DB.main.get_js('int:loos_elec:pwr_act'), io_every=1.0)
-    MET_TODAY_WH = Tag(read=lambda: DB.main.get_js('float:loos_elec:today_wh'), io_every=2.0)
-    MET_YESTERDAY_WH = Tag(read=lambda: DB.main.get_js('float:loos_elec:yesterday_wh'), io_every=2.0)
-    L_FLYSPRAY_RSS = Tag(read=lambda: DB.main.get_js('json:flyspray-nord'), io_every=2.0)
-    IMG_ATMO_HDF = Tag(read=lambda: DB.main.get('img:static:logo-atmo-hdf:png'), io_every=10.0)
-    IMG_LOGO_GRT = Tag(read=lambda: DB.main.get('img:static:logo-grt:png'), io_every=10.0)
-    IMG_TRAFFIC_MAP = Tag(read=lambda: DB.main.get('img:traffic-map:png'), io_every=10.0)
-    IMG_CAM_GATE = Tag(read=lambda: DB.main.get('img:cam-gate:jpg'), io_every=2.0)
-    IMG_CAM_DOOR_1 = Tag(read=lambda: DB.main.get('img:cam-door-1:jpg'), io_every=2.0)
-    IMG_CAM_DOOR_2 = Tag(read=lambda: DB.main.get('img:cam-door-2:jpg'), io_every=2.0)
-    DIR_CAROUSEL_RAW = Tag(read=lambda: DB.main.hgetall('dir:carousel:raw:min-png'), io_every=10.0)
-    PDF_FILENAMES_L = Tag(read=lambda: map(bytes.decode, DB.main.hkeys('dir:doc:raw')))
+    IO_NOTIFY = True
+    D_GSHEET_GRT = Tag(read=RedisRead(DB.main, 'get', 'json:gsheet', js=True), io_every=2.0)
+    D_ATMO_QUALITY = Tag(read=RedisRead(DB.main, 'get', 'json:atmo', js=True), io_every=2.0)
+    D_W_TODAY_LOOS = Tag(read=RedisRead(DB.main, 'get', 'json:weather:today:loos', js=True), io_every=2.0)
+    D_W_FORECAST_LOOS = Tag(read=RedisRead(DB.main, 'get', 'json:weather:forecast:loos', js=True), io_every=2.0)
+    D_WEATHER_VIG = Tag(read=RedisRead(DB.main, 'get', 'json:vigilance', js=True), io_every=2.0)
+    D_NEWS_LOCAL = Tag(read=RedisRead(DB.main, 'get', 'json:news', js=True), io_every=2.0)
+    MET_PWR_ACT = Tag(read=RedisRead(DB.main, 'get', 'int:loos_elec:pwr_act', js=True), io_every=1.0)
+    MET_TODAY_WH = Tag(read=RedisRead(DB.main, 'get', 'float:loos_elec:today_wh', js=True), io_every=2.0)
+    MET_YESTERDAY_WH = Tag(read=RedisRead(DB.main, 'get', 'float:loos_elec:yesterday_wh', js=True), io_every=2.0)
+    L_FLYSPRAY_RSS = Tag(read=RedisRead(DB.main, 'get', 'json:flyspray-nord', js=True), io_every=2.0)
+    IMG_ATMO_HDF = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-atmo-hdf:png'), io_every=10.0)
+    IMG_LOGO_GRT = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-grt:png'), io_every=10.0)
+    IMG_TRAFFIC_MAP = Tag(read=RedisRead(DB.main, 'get', 'img:traffic-map:png'), io_every=10.0)
+    IMG_CAM_GATE = Tag(read=RedisRead(DB.main, 'get', 'img:cam-gate:jpg'), io_every=2.0)
+    IMG_CAM_DOOR_1 = Tag(read=RedisRead(DB.main, 'get', 'img:cam-door-1:jpg'), io_every=2.0)
+    IMG_CAM_DOOR_2 = Tag(read=RedisRead(DB.main, 'get', 'img:cam-door-2:jpg'), io_every=2.0)
+    DIR_CAROUSEL_NAMES = Tag(read=RedisRead(DB.main, 'hkeys', 'dir:carousel:raw:min-png'), io_every=10.0)
+    PDF_FILENAMES_L = Tag(read=RedisRead(DB.main, 'hkeys', 'dir:doc:raw'), io_every=5.0)
     PDF_CONTENT = Tag(read=lambda file: DB.main.hget('dir:doc:raw', file))
 
 
@@ -50,6 +51,14 @@ class RemRedisActionsTask(AsyncTask):
         logging.info(f'request "{item}" action')
         DB.remote.publish(channel='pub:actions', message=item)
 
+    def do_batch(self, items_l: List[Any]):
+        # publish all pending actions in one round trip
+        pipe = DB.remote.pipeline(transaction=False)
+        for item in items_l:
+            logging.info(f'request "{item}" action')
+            pipe.publish(channel='pub:actions', message=item)
+        pipe.execute()
+
 
 class AsyncTasks:
     rem_redis_actions = RemRedisActionsTask(max_items=3)
@@ -68,13 +77,16 @@ class MainApp(tk.Tk):
         # define notebook
         self.note = ttk.Notebook(self)
         self.tab1 = LiveTilesTab(self.note, tiles_size=(17, 9))
-        self.tab2 = PdfTilesTab(self.note, tiles_size=(17, 12),
-                                list_tag=Tags.PDF_FILENAMES_L, raw_tag=Tags.PDF_CONTENT)
+        # PDF tab content is build at first display (a dashboard kiosk rarely use it)
+        self.tab2 = tk.Frame(self.note)
+        self.tab2_pdf = None
         self.note.add(self.tab1, text='Tableau de bord')
         self.note.add(self.tab2, text='Affichage réglementaire')
         self.note.pack()
         # default tab
         self.note.select(self.tab1)
+        # pause news banner when its tab is not selected
+        self.note.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         # press Esc to quit
         self.bind('<Escape>', lambda evt: self.destroy())
         # bind function keys to tabs
@@ -88,6 +100,17 @@ class MainApp(tk.Tk):
         self.bind_all('<Any-KeyPress>', self._trig_user_idle_t)
         self.bind_all('<Any-ButtonPress>', self._trig_user_idle_t)
 
+    def _on_tab_changed(self, _evt):
+        selected = self.note.select()
+        if selected == str(self.tab1):
+            self.tab1.tl_news.resume()
+        else:
+            self.tab1.tl_news.pause()
+        if selected == str(self.tab2) and self.tab2_pdf is None:
+            self.tab2_pdf = PdfTilesTab(self.tab2, tiles_size=(17, 12),
+                                        list_tag=Tags.PDF_FILENAMES_L, raw_tag=Tags.PDF_CONTENT)
+            self.tab2_pdf.pack(fill=tk.BOTH, expand=True)
+
     def _trig_user_idle_t(self, _evt):
         # cancel the previous event
         self.after_cancel(self._idle_timer)
@@ -157,6 +180,11 @@ class LiveTilesTab(TilesTab):
         self.tl_g_vst.set_tile(row=5, column=13, columnspan=2)
         self.tl_g_qsc = GaugeTile(self, title='1/4h sécurité')
         self.tl_g_qsc.set_tile(row=5, column=15, columnspan=2)
+        # gauges with their gsheet tags code (tags are "{code}_JAUGE_DTS", "{code}_REAL_DTS" and "{code}_OBJ_DTS")
+        gauges_codes = ((self.tl_g_veh, 'IGP_VEH'), (self.tl_g_loc, 'IGP_LOC'), (self.tl_g_req, 'R_EQU'),
+                        (self.tl_g_vcs, 'VCS'), (self.tl_g_vst, 'VST'), (self.tl_g_qsc, 'Q_HRE'))
+        self._gauges = tuple((tile, f'{code}_JAUGE_DTS', f'{code}_REAL_DTS', f'{code}_OBJ_DTS')
+                             for tile, code in gauges_codes)
         # weather vigilance
         self.tl_vig_59 = VigilanceTile(self, department='Nord')
         self.tl_vig_59.set_tile(row=4, column=0)
@@ -168,6 +196,8 @@ class LiveTilesTab(TilesTab):
         self.tl_vig_02.set_tile(row=4, column=3)
         self.tl_vig_60 = VigilanceTile(self, department='Oise')
         self.tl_vig_60.set_tile(row=4, column=4)
+        self._vigilances = ((self.tl_vig_59, '59'), (self.tl_vig_62, '62'),
+                            (self.tl_vig_80, '80'), (self.tl_vig_02, '02'), (self.tl_vig_60, '60'))
         # Watts news
         self.tl_watts = WattsTile(self)
         self.tl_watts.set_tile(row=4, column=5, columnspan=2)
@@ -181,77 +211,68 @@ class LiveTilesTab(TilesTab):
         self.tl_img_grt = ImageRawTile(self, bg='white')
         self.tl_img_grt.set_tile(row=6, column=13, rowspan=2, columnspan=4)
         # carousel
-        self.tl_crl = ImageRawCarouselTile(self, bg='white', raw_img_tag_d=Tags.DIR_CAROUSEL_RAW)
+        self.tl_crl = ImageRawCarouselTile(self, bg='white', names_tag=Tags.DIR_CAROUSEL_NAMES,
+                                             raw_read=lambda name: DB.main.hget('dir:carousel:raw:min-png', name))
         self.tl_crl.set_tile(row=4, column=7, rowspan=4, columnspan=6)
         # start auto-update
         self.init_cyclic_update(every_ms=5_000)
-        # at startup:
-        # trig update after 2s to let Tags io_thread populate values
-        self.after(ms=2_000, func=self.update)
 
     def update(self):
         # traffic map
-        self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get())
+        if self.tags_changed(Tags.IMG_TRAFFIC_MAP):
+            self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get())
         # atmo
-        self.tl_img_atmo.load(Tags.IMG_ATMO_HDF.get())
+        if self.tags_changed(Tags.IMG_ATMO_HDF):
+            self.tl_img_atmo.load(Tags.IMG_ATMO_HDF.get())
         # GRT
-        self.tl_img_grt.load(Tags.IMG_LOGO_GRT.get())
-        # acc days stat
-        self.tl_acc.load(date_dts=Tags.D_GSHEET_GRT.get(path=('tags', 'DATE_ACC_DTS')),
-                         date_digne=Tags.D_GSHEET_GRT.get(path=('tags', 'DATE_ACC_DIGNE')))
+        if self.tags_changed(Tags.IMG_LOGO_GRT):
+            self.tl_img_grt.load(Tags.IMG_LOGO_GRT.get())
         # weather
-        self.tl_weath.load(w_today_dict=Tags.D_W_TODAY_LOOS.get(),
-                           w_forecast_dict=Tags.D_W_FORECAST_LOOS.get())
-        # air Dunkerque
-        self.tl_atmo_dunk.load(level=Tags.D_ATMO_QUALITY.get(path='dunkerque'))
-        # air Lille
-        self.tl_atmo_lil.load(level=Tags.D_ATMO_QUALITY.get(path='lille'))
-        # air Maubeuge
-        self.tl_atmo_maub.load(level=Tags.D_ATMO_QUALITY.get(path='maubeuge'))
-        # air Saint-Quentin
-        self.tl_atmo_sque.load(level=Tags.D_ATMO_QUALITY.get(path='saint-quentin'))
+        if self.tags_changed(Tags.D_W_TODAY_LOOS, Tags.D_W_FORECAST_LOOS):
+            self.tl_weath.load(w_today_dict=Tags.D_W_TODAY_LOOS.get(),
+                               w_forecast_dict=Tags.D_W_FORECAST_LOOS.get())
+        # air quality
+        if self.tags_changed(Tags.D_ATMO_QUALITY):
+            # snapshots are taken after the version check (a newer value is never hidden by an older render)
+            # and once by block (all widgets see the same values)
+            atmo = Tags.D_ATMO_QUALITY.get() or {}
+            self.tl_atmo_dunk.load(level=atmo.get('dunkerque'))
+            self.tl_atmo_lil.load(level=atmo.get('lille'))
+            self.tl_atmo_maub.load(level=atmo.get('maubeuge'))
+            self.tl_atmo_sque.load(level=atmo.get('saint-quentin'))
         # cams
-        self.tl_cam_gate.load(Tags.IMG_CAM_GATE.get())
-        self.tl_cam_door_1.load(Tags.IMG_CAM_DOOR_1.get())
-        self.tl_cam_door_2.load(Tags.IMG_CAM_DOOR_2.get())
-        # gauges update
-        self.tl_g_veh.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_OBJ_DTS'))))
-        self.tl_g_loc.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_OBJ_DTS'))))
-        self.tl_g_req.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_OBJ_DTS'))))
-        self.tl_g_vcs.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_OBJ_DTS'))))
-        self.tl_g_vst.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'VST_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'VST_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'VST_OBJ_DTS'))))
-        self.tl_g_qsc.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_OBJ_DTS'))))
+        if self.tags_changed(Tags.IMG_CAM_GATE):
+            self.tl_cam_gate.load(Tags.IMG_CAM_GATE.get())
+        if self.tags_changed(Tags.IMG_CAM_DOOR_1):
+            self.tl_cam_door_1.load(Tags.IMG_CAM_DOOR_1.get())
+        if self.tags_changed(Tags.IMG_CAM_DOOR_2):
+            self.tl_cam_door_2.load(Tags.IMG_CAM_DOOR_2.get())
+        # acc days stat and gauges update
+        if self.tags_changed(Tags.D_GSHEET_GRT):
+            gs_tags = Tags.D_GSHEET_GRT.get(path='tags') or {}
+            self.tl_acc.load(date_dts=gs_tags.get('DATE_ACC_DTS'),
+                             date_digne=gs_tags.get('DATE_ACC_DIGNE'))
+            for tile, jauge_key, real_key, obj_key in self._gauges:
+                real, obj = gs_tags.get(real_key), gs_tags.get(obj_key)
+                tile.load(percent=gs_tags.get(jauge_key),
+                          head_str=None if real is None or obj is None else f'{real}/{obj}')
         # vigilance
-        self.tl_vig_59.load(level=Tags.D_WEATHER_VIG.get(path=('department', '59', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '59', 'risk_id')))
-        self.tl_vig_62.load(level=Tags.D_WEATHER_VIG.get(path=('department', '62', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '62', 'risk_id')))
-        self.tl_vig_80.load(level=Tags.D_WEATHER_VIG.get(path=('department', '80', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '80', 'risk_id')))
-        self.tl_vig_02.load(level=Tags.D_WEATHER_VIG.get(path=('department', '02', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '02', 'risk_id')))
-        self.tl_vig_60.load(level=Tags.D_WEATHER_VIG.get(path=('department', '60', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '60', 'risk_id')))
+        if self.tags_changed(Tags.D_WEATHER_VIG):
+            vig_deps = Tags.D_WEATHER_VIG.get(path='department') or {}
+            for tile, dep in self._vigilances:
+                tile.load(level=dict_path(vig_deps, (dep, 'vig_level')),
+                          risk_id_l=dict_path(vig_deps, (dep, 'risk_id')))
         # Watts news
-        self.tl_watts.load(pwr=Tags.MET_PWR_ACT.get(),
-                           today_wh=Tags.MET_TODAY_WH.get(),
-                           yesterday_wh=Tags.MET_YESTERDAY_WH.get())
+        if self.tags_changed(Tags.MET_PWR_ACT, Tags.MET_TODAY_WH, Tags.MET_YESTERDAY_WH):
+            self.tl_watts.load(pwr=Tags.MET_PWR_ACT.get(),
+                               today_wh=Tags.MET_TODAY_WH.get(),
+                               yesterday_wh=Tags.MET_YESTERDAY_WH.get())
         # flyspray
-        self.tl_fly.load(task_l=Tags.L_FLYSPRAY_RSS.get())
+        if self.tags_changed(Tags.L_FLYSPRAY_RSS):
+            self.tl_fly.load(task_l=Tags.L_FLYSPRAY_RSS.get())
         # update news widget
-        self.tl_news.load(titles_l=Tags.D_NEWS_LOCAL.get())
+        if self.tags_changed(Tags.D_NEWS_LOCAL):
+            self.tl_news.load(titles_l=Tags.D_NEWS_LOCAL.get())
 
     def _on_click_gate_tile(self):
         AsyncTasks.rem_redis_actions.add(item='open-car')
@@ -2,10 +2,10 @@
 
 import argparse
 import logging
-from typing import Any
+from typing import Any, List
 import tkinter as tk
-from lib.dashboard_ui import AsyncTask, Colors, CustomRedis, ClockTile, ImageRawTile, TilesTab, Tag, TagsBase, Tile, \
-    wait_uptime
+from lib.dashboard_ui import AsyncTask, Colors, CustomRedis, ClockTile, ImageRawTile, RedisRead, TilesTab, Tag, \
+    TagsBase, Tile, shared_font, wait_uptime
 from conf.private_mag import REDIS_USER, REDIS_PASS, REM_REDIS_HOST, REM_REDIS_PORT, REM_REDIS_USER, REM_REDIS_PASS
 
 
@@ -22,9 +22,10 @@ class Tags(TagsBase):
     # WARNs: -> all tags with io_every set are manage by an independent (of tk mainloop) IO thread
     #           this thread periodically update tag value and avoid tk GUI loop do this and lose time on DB IO
     #        -> tags callbacks (read/write methods) are call by this IO thread (not by tkinter main thread)
-    IMG_CAM_GATE = Tag(read=lambda: DB.main.get('img:cam-gate:jpg'), io_every=2.0)
-    IMG_CAM_DOOR_1 = Tag(read=lambda: DB.main.get('img:cam-door-1:jpg'), io_every=2.0)
-    IMG_CAM_DOOR_2 = Tag(read=lambda: DB.main.get('img:cam-door-2:jpg'), io_every=2.0)
+    IO_NOTIFY = True
+    IMG_CAM_GATE = Tag(read=RedisRead(DB.main, 'get', 'img:cam-gate:jpg'), io_every=2.0)
+    IMG_CAM_DOOR_1 = Tag(read=RedisRead(DB.main, 'get', 'img:cam-door-1:jpg'), io_every=2.0)
+    IMG_CAM_DOOR_2 = Tag(read=RedisRead(DB.main, 'get', 'img:cam-door-2:jpg'), io_every=2.0)
 
 
 class RemRedisActionsTask(AsyncTask):
@@ -32,6 +33,14 @@ class RemRedisActionsTask(AsyncTask):
         logging.info(f'request "{item}" action')
         DB.remote.publish(channel='pub:actions', message=item)
 
+    def do_batch(self, items_l: List[Any]):
+        # publish all pending actions in one round trip
+        pipe = DB.remote.pipeline(transaction=False)
+        for item in items_l:
+            logging.info(f'request "{item}" action')
+            pipe.publish(channel='pub:actions', message=item)
+        pipe.execute()
+
 
 class AsyncTasks:
     rem_redis_actions = RemRedisActionsTask(max_items=3)
@@ -41,7 +50,7 @@ class CustomLabelTile(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
         self.str_var = tk.StringVar()
-        tk.Label(self, textvariable=self.str_var, font=('bold', 12), bg=self.cget('bg'),
+        tk.Label(self, textvariable=self.str_var, font=shared_font(('bold', 12)), bg=self.cget('bg'),
                  anchor=tk.W, justify=tk.LEFT, fg=Colors.TXT).place(relx=0, rely=0)
 
     def load(self, txt: str) -> None:
@@ -104,15 +113,15 @@ class LiveTilesTab(TilesTab):
         self.tl_clock.set_tile(row=2, column=0, rowspan=2, columnspan=8)
         # start auto-update
         self.init_cyclic_update(every_ms=5_000)
-        # at startup:
-        # trig update after 2s to let Tags io_thread populate values
-        self.after(ms=2_000, func=self.update)
 
     def update(self):
         # cams
-        self.tl_cam_gate.load(Tags.IMG_CAM_GATE.get())
-        self.tl_cam_door_1.load(Tags.IMG_CAM_DOOR_1.get())
-        self.tl_cam_door_2.load(Tags.IMG_CAM_DOOR_2.get())
+        if self.tags_changed(Tags.IMG_CAM_GATE):
+            self.tl_cam_gate.load(Tags.IMG_CAM_GATE.get())
+        if self.tags_changed(Tags.IMG_CAM_DOOR_1):
+            self.tl_cam_door_1.load(Tags.IMG_CAM_DOOR_1.get())
+        if self.tags_changed(Tags.IMG_CAM_DOOR_2):
+            self.tl_cam_door_2.load(Tags.IMG_CAM_DOOR_2.get())
 
     def _on_click_gate_tile(self):
         AsyncTasks.rem_redis_actions.add(item='open-car')
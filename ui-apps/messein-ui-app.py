@@ -5,7 +5,7 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 from lib.dashboard_ui import \
-    CustomRedis, EmptyTile, Tag, TagsBase, TilesTab, PdfTilesTab, wait_uptime, \
+    CustomRedis, EmptyTile, RedisRead, Tag, TagsBase, TilesTab, PdfTilesTab, dict_path, wait_uptime, \
     AirQualityTile, ClockTile, DaysAccTileMessein, FlysprayTile, GaugeTile, \
     ImageRawTile, ImageRawCarouselTile, NewsBannerTile, VigilanceTile
 from conf.private_messein import REDIS_USER, REDIS_PASS
@@ -22,20 +22,21 @@ class Tags(TagsBase):
     # WARNs: -> all tags with io_every set are manage by an independent (of tk mainloop) IO thread
     #           this thread periodically update tag value and avoid tk GUI loop do this and lose time on DB IO
     #        -> tags callbacks (read/write methods) are call by this IO thread (not by tkinter main thread)
-    D_GSHEET_GRT = Tag(read=lambda: DB.main.get_js('json:gsheet'), io_every=2.0)
-    D_ATMO_QUALITY = Tag(read=lambda: DB.main.get_js('json:atmo'), io_every=2.0)
-    D_WEATHER_VIG = Tag(read=lambda: DB.main.get_js('json:vigilance'), io_every=2.0)
-    D_NEWS_LOCAL = Tag(read=lambda: DB.main.get_js('json:news'), io_every=2.0)
-    L_FLYSPRAY_RSS = Tag(read=lambda: DB.main.get_js('from:loos:json:flyspray-est'), io_every=2.0)
-    IMG_ATMO_GE = Tag(read=lambda: DB.main.get('img:static:logo-atmo-ge:png'), io_every=10.0)
-    IMG_LOGO_GRT = Tag(read=lambda: DB.main.get('img:static:logo-grt:png'), io_every=10.0)
-    IMG_TRAFFIC_MAP = Tag(read=lambda: DB.main.get('img:traffic-map:png'), io_every=10.0)
-    IMG_DIR_CAM_HOUDEMONT = Tag(read=lambda: DB.main.get('img:dir-est:houdemont:png'), io_every=10.0)
-    IMG_DIR_CAM_VELAINE = Tag(read=lambda: DB.main.get('img:dir-est:velaine:png'), io_every=10.0)
-    IMG_DIR_CAM_ST_NICOLAS = Tag(read=lambda: DB.main.get('img:dir-est:st-nicolas:png'), io_every=10.0)
-    IMG_DIR_CAM_FLAVIGNY = Tag(read=lambda: DB.main.get('img:dir-est:flavigny:png'), io_every=10.0)
-    DIR_CAROUSEL_RAW = Tag(read=lambda: DB.main.hgetall('dir:carousel:raw:min-png'), io_every=10.0)
-    PDF_FILENAMES_L = Tag(read=lambda: map(bytes.decode, DB.main.hkeys('dir:doc:raw')))
+    IO_NOTIFY = True
+    D_GSHEET_GRT = Tag(read=RedisRead(DB.main, 'get', 'json:gsheet', js=True), io_every=2.0)
+    D_ATMO_QUALITY = Tag(read=RedisRead(DB.main, 'get', 'json:atmo', js=True), io_every=2.0)
+    D_WEATHER_VIG = Tag(read=RedisRead(DB.main, 'get', 'json:vigilance', js=True), io_every=2.0)
+    D_NEWS_LOCAL = Tag(read=RedisRead(DB.main, 'get', 'json:news', js=True), io_every=2.0)
+    L_FLYSPRAY_RSS = Tag(read=RedisRead(DB.main, 'get', 'from:loos:json:flyspray-est', js=True), io_every=2.0)
+    IMG_ATMO_GE = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-atmo-ge:png'), io_every=10.0)
+    IMG_LOGO_GRT = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-grt:png'), io_every=10.0)
+    IMG_TRAFFIC_MAP = Tag(read=RedisRead(DB.main, 'get', 'img:traffic-map:png'), io_every=10.0)
+    IMG_DIR_CAM_HOUDEMONT = Tag(read=RedisRead(DB.main, 'get', 'img:dir-est:houdemont:png'), io_every=10.0)
+    IMG_DIR_CAM_VELAINE = Tag(read=RedisRead(DB.main, 'get', 'img:dir-est:velaine:png'), io_every=10.0)
+    IMG_DIR_CAM_ST_NICOLAS = Tag(read=RedisRead(DB.main, 'get', 'img:dir-est:st-nicolas:png'), io_every=10.0)
+    IMG_DIR_CAM_FLAVIGNY = Tag(read=RedisRead(DB.main, 'get', 'img:dir-est:flavigny:png'), io_every=10.0)
+    DIR_CAROUSEL_NAMES = Tag(read=RedisRead(DB.main, 'hkeys', 'dir:carousel:raw:min-png'), io_every=10.0)
+    PDF_FILENAMES_L = Tag(read=RedisRead(DB.main, 'hkeys', 'dir:doc:raw'), io_every=5.0)
     PDF_CONTENT = Tag(read=lambda file: DB.main.hget('dir:doc:raw', file))
 
 
@@ -52,13 +53,16 @@ class MainApp(tk.Tk):
         # define notebook
         self.note = ttk.Notebook(self)
         self.tab1 = LiveTilesTab(self.note, tiles_size=(17, 9))
-        self.tab2 = PdfTilesTab(self.note, tiles_size=(17, 9),
-                                list_tag=Tags.PDF_FILENAMES_L, raw_tag=Tags.PDF_CONTENT)
+        # PDF tab content is build at first display (a dashboard kiosk rarely use it)
+        self.tab2 = tk.Frame(self.note)
+        self.tab2_pdf = None
         self.note.add(self.tab1, text='Tableau de bord')
         self.note.add(self.tab2, text='Affichage réglementaire')
         self.note.pack()
         # default tab
         self.note.select(self.tab1)
+        # pause news banner when its tab is not selected
+        self.note.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         # press Esc to quit
         self.bind('<Escape>', lambda e: self.destroy())
         # bind function keys to tabs
@@ -72,6 +76,17 @@ class MainApp(tk.Tk):
         self.bind_all('<Any-KeyPress>', self._trig_user_idle_t)
         self.bind_all('<Any-ButtonPress>', self._trig_user_idle_t)
 
+    def _on_tab_changed(self, _evt):
+        selected = self.note.select()
+        if selected == str(self.tab1):
+            self.tab1.tl_news.resume()
+        else:
+            self.tab1.tl_news.pause()
+        if selected == str(self.tab2) and self.tab2_pdf is None:
+            self.tab2_pdf = PdfTilesTab(self.tab2, tiles_size=(17, 9),
+                                        list_tag=Tags.PDF_FILENAMES_L, raw_tag=Tags.PDF_CONTENT)
+            self.tab2_pdf.pack(fill=tk.BOTH, expand=True)
+
     def _trig_user_idle_t(self, _evt):
         # cancel the previous event
         self.after_cancel(self._idle_timer)
@@ -138,6 +153,11 @@ class LiveTilesTab(TilesTab):
         self.tl_g_vst.set_tile(row=5, column=13, columnspan=2)
         self.tl_g_qsc = GaugeTile(self, title='1/4h sécurité')
         self.tl_g_qsc.set_tile(row=5, column=15, columnspan=2)
+        # gauges with their gsheet tags code (tags are "{code}_JAUGE_DTS", "{code}_REAL_DTS" and "{code}_OBJ_DTS")
+        gauges_codes = ((self.tl_g_veh, 'IGP_VEH'), (self.tl_g_loc, 'IGP_LOC'), (self.tl_g_req, 'R_EQU'),
+                        (self.tl_g_vcs, 'VCS'), (self.tl_g_vst, 'VST'), (self.tl_g_qsc, 'Q_HRE'))
+        self._gauges = tuple((tile, f'{code}_JAUGE_DTS', f'{code}_REAL_DTS', f'{code}_OBJ_DTS')
+                             for tile, code in gauges_codes)
         # weather vigilance
         self.tl_vig_54 = VigilanceTile(self, department='Meurthe & M')
         self.tl_vig_54.set_tile(row=4, column=0)
@@ -149,6 +169,8 @@ class LiveTilesTab(TilesTab):
         self.tl_vig_88.set_tile(row=4, column=3)
         self.tl_vig_67 = VigilanceTile(self, department='Bas-Rhin')
         self.tl_vig_67.set_tile(row=4, column=4)
+        self._vigilances = ((self.tl_vig_54, '54'), (self.tl_vig_55, '55'),
+                            (self.tl_vig_57, '57'), (self.tl_vig_88, '88'), (self.tl_vig_67, '67'))
         # empty area(s)
         self.tl_empty1 = EmptyTile(self)
         self.tl_empty1.set_tile(row=2, column=5, rowspan=2, columnspan=8)
@@ -164,70 +186,60 @@ class LiveTilesTab(TilesTab):
         self.tl_img_grt = ImageRawTile(self, bg='white')
         self.tl_img_grt.set_tile(row=6, column=13, rowspan=2, columnspan=4)
         # carousel
-        self.tl_crl = ImageRawCarouselTile(self, bg='white', raw_img_tag_d=Tags.DIR_CAROUSEL_RAW)
+        self.tl_crl = ImageRawCarouselTile(self, bg='white', names_tag=Tags.DIR_CAROUSEL_NAMES,
+                                             raw_read=lambda name: DB.main.hget('dir:carousel:raw:min-png', name))
         self.tl_crl.set_tile(row=4, column=7, rowspan=4, columnspan=6)
         # start auto-update
         self.init_cyclic_update(every_ms=5_000)
-        # at startup:
-        # trig update after 1s to let Tags io_thread populate values
-        self.after(ms=1000, func=self.update)
 
     def update(self):
         # traffic map
-        self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get())
+        if self.tags_changed(Tags.IMG_TRAFFIC_MAP):
+            self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get())
         # atmo
-        self.tl_img_atmo.load(Tags.IMG_ATMO_GE.get())
+        if self.tags_changed(Tags.IMG_ATMO_GE):
+            self.tl_img_atmo.load(Tags.IMG_ATMO_GE.get())
         # GRT
-        self.tl_img_grt.load(Tags.IMG_LOGO_GRT.get())
+        if self.tags_changed(Tags.IMG_LOGO_GRT):
+            self.tl_img_grt.load(Tags.IMG_LOGO_GRT.get())
         # DIR-Est webcams
-        self.tl_img_houdemont.load = Tags.IMG_DIR_CAM_HOUDEMONT.get()
-        self.tl_img_velaine.load = Tags.IMG_DIR_CAM_VELAINE.get()
-        self.tl_img_st_nicolas.load = Tags.IMG_DIR_CAM_ST_NICOLAS.get()
-        self.tl_img_flavigny.load = Tags.IMG_DIR_CAM_FLAVIGNY.get()
-        # acc days stat
-        self.tl_acc.load(date_dts=Tags.D_GSHEET_GRT.get(path=('tags', 'DATE_ACC_DTS')))
-        # air Nancy
-        self.tl_atmo_nancy.load(level=Tags.D_ATMO_QUALITY.get(path='nancy'))
-        # air Metz
-        self.tl_atmo_metz.load(level=Tags.D_ATMO_QUALITY.get(path='metz'))
-        # air Reims
-        self.tl_atmo_reims.load(level=Tags.D_ATMO_QUALITY.get(path='reims'))
-        # air Strasbourg
-        self.tl_atmo_stras.load(level=Tags.D_ATMO_QUALITY.get(path='strasbourg'))
+        if self.tags_changed(Tags.IMG_DIR_CAM_HOUDEMONT):
+            self.tl_img_houdemont.load(Tags.IMG_DIR_CAM_HOUDEMONT.get())
+        if self.tags_changed(Tags.IMG_DIR_CAM_VELAINE):
+            self.tl_img_velaine.load(Tags.IMG_DIR_CAM_VELAINE.get())
+        if self.tags_changed(Tags.IMG_DIR_CAM_ST_NICOLAS):
+            self.tl_img_st_nicolas.load(Tags.IMG_DIR_CAM_ST_NICOLAS.get())
+        if self.tags_changed(Tags.IMG_DIR_CAM_FLAVIGNY):
+            self.tl_img_flavigny.load(Tags.IMG_DIR_CAM_FLAVIGNY.get())
+        # air quality
+        if self.tags_changed(Tags.D_ATMO_QUALITY):
+            # snapshots are taken after the version check (a newer value is never hidden by an older render)
+            # and once by block (all widgets see the same values)
+            atmo = Tags.D_ATMO_QUALITY.get() or {}
+            self.tl_atmo_nancy.load(level=atmo.get('nancy'))
+            self.tl_atmo_metz.load(level=atmo.get('metz'))
+            self.tl_atmo_reims.load(level=atmo.get('reims'))
+            self.tl_atmo_stras.load(level=atmo.get('strasbourg'))
         # news banner
-        self.tl_news.load(titles_l=Tags.D_NEWS_LOCAL.get())
-        # gauges update
-        self.tl_g_veh.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_VEH_OBJ_DTS'))))
-        self.tl_g_loc.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'IGP_LOC_OBJ_DTS'))))
-        self.tl_g_req.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_REAL_DTS')),
-                                                 Tags.D_GSHEET_GRT.get(path=('tags', 'R_EQU_OBJ_DTS'))))
-        self.tl_g_vcs.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'VCS_OBJ_DTS'))))
-        self.tl_g_vst.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'VST_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'VST_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'VST_OBJ_DTS'))))
-        self.tl_g_qsc.load(percent=Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_JAUGE_DTS')),
-                           head_str='%s/%s' % (Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_REAL_DTS')),
-                                               Tags.D_GSHEET_GRT.get(path=('tags', 'Q_HRE_OBJ_DTS'))))
+        if self.tags_changed(Tags.D_NEWS_LOCAL):
+            self.tl_news.load(titles_l=Tags.D_NEWS_LOCAL.get())
+        # acc days stat and gauges update
+        if self.tags_changed(Tags.D_GSHEET_GRT):
+            gs_tags = Tags.D_GSHEET_GRT.get(path='tags') or {}
+            self.tl_acc.load(date_dts=gs_tags.get('DATE_ACC_DTS'))
+            for tile, jauge_key, real_key, obj_key in self._gauges:
+                real, obj = gs_tags.get(real_key), gs_tags.get(obj_key)
+                tile.load(percent=gs_tags.get(jauge_key),
+                          head_str=None if real is None or obj is None else f'{real}/{obj}')
         # weather vigilance
-        self.tl_vig_54.load(level=Tags.D_WEATHER_VIG.get(path=('department', '54', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '54', 'risk_id')))
-        self.tl_vig_55.load(level=Tags.D_WEATHER_VIG.get(path=('department', '55', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '55', 'risk_id')))
-        self.tl_vig_57.load(level=Tags.D_WEATHER_VIG.get(path=('department', '57', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '57', 'risk_id')))
-        self.tl_vig_88.load(level=Tags.D_WEATHER_VIG.get(path=('department', '88', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '88', 'risk_id')))
-        self.tl_vig_67.load(level=Tags.D_WEATHER_VIG.get(path=('department', '67', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '67', 'risk_id')))
+        if self.tags_changed(Tags.D_WEATHER_VIG):
+            vig_deps = Tags.D_WEATHER_VIG.get(path='department') or {}
+            for tile, dep in self._vigilances:
+                tile.load(level=dict_path(vig_deps, (dep, 'vig_level')),
+                          risk_id_l=dict_path(vig_deps, (dep, 'risk_id')))
         # flyspray
-        self.tl_fly.load(task_l=Tags.L_FLYSPRAY_RSS.get())
+        if self.tags_changed(Tags.L_FLYSPRAY_RSS):
+            self.tl_fly.load(task_l=Tags.L_FLYSPRAY_RSS.get())
 
 
 # main
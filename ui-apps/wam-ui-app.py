@@ -5,8 +5,8 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 from lib.dashboard_ui import \
-    Colors, CustomRedis, Tag, TagsBase, Tile, TilesTab, fmt_value, wait_uptime, \
-    AirQualityTile, ClockTile, EmptyTile,  ImageRawTile, VigilanceTile
+    Colors, CustomRedis, RedisRead, Tag, TagsBase, Tile, TilesTab, dict_path, fmt_value, shared_font, wait_uptime, \
+    AirQualityTile, ClockTile, ImageRawTile, VigilanceTile
 from conf.private_wam import REDIS_USER, REDIS_PASS
 
 
@@ -21,27 +21,31 @@ class Tags(TagsBase):
     # WARNs: -> all tags with io_every set are manage by an independent (of tk mainloop) IO thread
     #           this thread periodically update tag value and avoid tk GUI loop do this and lose time on DB IO
     #        -> tags callbacks (read/write methods) are call by this IO thread (not by tkinter main thread)
-    D_ATMO_QUALITY = Tag(read=lambda: DB.main.get_js('json:atmo'), io_every=2.0)
-    D_WEATHER_VIG = Tag(read=lambda: DB.main.get_js('json:vigilance'), io_every=2.0)
-    BLE_SENSOR_DATA = Tag(read=lambda: DB.main.get_js('json:ble-data'), io_every=2.0)
-    METAR_DATA = Tag(read=lambda: DB.main.get_js('json:metar:lesquin'), io_every=2.0)
-    IMG_ATMO_HDF = Tag(read=lambda: DB.main.get('img:static:logo-atmo-hdf:png'), io_every=10.0)
-    IMG_MF = Tag(read=lambda: DB.main.get('img:static:logo-mf:png'), io_every=10.0)
-    IMG_TRAFFIC_MAP = Tag(read=lambda: DB.main.get('img:traffic-map:png'), io_every=10.0)
+    IO_NOTIFY = True
+    D_ATMO_QUALITY = Tag(read=RedisRead(DB.main, 'get', 'json:atmo', js=True), io_every=2.0)
+    D_WEATHER_VIG = Tag(read=RedisRead(DB.main, 'get', 'json:vigilance', js=True), io_every=2.0)
+    BLE_SENSOR_DATA = Tag(read=RedisRead(DB.main, 'get', 'json:ble-data', js=True), io_every=2.0)
+    METAR_DATA = Tag(read=RedisRead(DB.main, 'get', 'json:metar:lesquin', js=True), io_every=2.0)
+    IMG_ATMO_HDF = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-atmo-hdf:png'), io_every=10.0)
+    IMG_MF = Tag(read=RedisRead(DB.main, 'get', 'img:static:logo-mf:png'), io_every=10.0)
+    IMG_TRAFFIC_MAP = Tag(read=RedisRead(DB.main, 'get', 'img:traffic-map:png'), io_every=10.0)
 
 
 class CustomLabelTile(Tile):
     def __init__(self, *args, **kwargs):
         Tile.__init__(self, *args, **kwargs)
         self.str_var = tk.StringVar()
-        tk.Label(self, textvariable=self.str_var, font=('bold', 12), bg=self.cget('bg'),
+        self._txt = None
+        tk.Label(self, textvariable=self.str_var, font=shared_font(('bold', 12)), bg=self.cget('bg'),
                  anchor=tk.W, justify=tk.LEFT, fg=Colors.TXT).place(relx=0, rely=0)
 
     def load(self, txt: str) -> None:
         # enforce type
         txt = str(txt)
-        # update widget
-        self.str_var.set(txt)
+        # update widget on change (compare with a local copy, StringVar.get() is a tcl call)
+        if txt != self._txt:
+            self._txt = txt
+            self.str_var.set(txt)
 
 
 class MainApp(tk.Tk):
@@ -104,6 +108,7 @@ class LiveTilesTab(TilesTab):
         self.tl_vig_59.set_tile(row=0, column=3)
         self.tl_vig_62 = VigilanceTile(self, department='62')
         self.tl_vig_62.set_tile(row=0, column=4)
+        self._vigilances = ((self.tl_vig_59, '59'), (self.tl_vig_62, '62'))
         # traffic map
         self.tl_tf_map = ImageRawTile(self, bg='#bbe2c6')
         self.tl_tf_map.set_tile(row=1, column=0, rowspan=3, columnspan=5)
@@ -116,53 +121,59 @@ class LiveTilesTab(TilesTab):
         # kitchen weather
         self.tl_kit = CustomLabelTile(self)
         self.tl_kit.set_tile(row=2, column=7, rowspan=1, columnspan=1)
+        self._ble_tiles = ((self.tl_ext, 'Extérieur', 'outdoor'), (self.tl_kit, 'Cuisine', 'kitchen'))
         # kitchen weather
         self.tl_metar = CustomLabelTile(self)
         self.tl_metar.set_tile(row=3, column=5, rowspan=1, columnspan=3)
         # start auto-update
         self.init_cyclic_update(every_ms=5_000)
-        # at startup:
-        # trig update after 2s to let Tags io_thread populate values
-        self.after(ms=2_000, func=self.update)
 
     def update(self):
         # atmo
-        self.tl_img_atmo.load(Tags.IMG_ATMO_HDF.get())
+        if self.tags_changed(Tags.IMG_ATMO_HDF):
+            self.tl_img_atmo.load(Tags.IMG_ATMO_HDF.get())
         # air Lille
-        self.tl_atmo_lil.load(level=Tags.D_ATMO_QUALITY.get(path='lille'))
+        if self.tags_changed(Tags.D_ATMO_QUALITY):
+            self.tl_atmo_lil.load(level=Tags.D_ATMO_QUALITY.get(path='lille'))
         # mf
-        self.tl_img_mf.load(Tags.IMG_MF.get())
+        if self.tags_changed(Tags.IMG_MF):
+            self.tl_img_mf.load(Tags.IMG_MF.get())
         # vigilance
-        self.tl_vig_59.load(level=Tags.D_WEATHER_VIG.get(path=('department', '59', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '59', 'risk_id')))
-        self.tl_vig_62.load(level=Tags.D_WEATHER_VIG.get(path=('department', '62', 'vig_level')),
-                            risk_id_l=Tags.D_WEATHER_VIG.get(path=('department', '62', 'risk_id')))
+        if self.tags_changed(Tags.D_WEATHER_VIG):
+            # snapshots are taken after the version check (a newer value is never hidden by an older render)
+            # and once by block (all widgets see the same values)
+            vig_deps = Tags.D_WEATHER_VIG.get(path='department') or {}
+            for tile, dep in self._vigilances:
+                tile.load(level=dict_path(vig_deps, (dep, 'vig_level')),
+                          risk_id_l=dict_path(vig_deps, (dep, 'risk_id')))
         # traffic map
-        self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get(), crop=(30, 0, 530, 328))
-        # outdoor ble data
-        temp_c = fmt_value(Tags.BLE_SENSOR_DATA.get(path=('outdoor', 'temp_c')), fmt='>6.1f')
-        hum_p = fmt_value(Tags.BLE_SENSOR_DATA.get(path=('outdoor', 'hum_p')), fmt='>6.1f')
-        self.tl_ext.load(txt=f'Extérieur\n\n\N{THERMOMETER} {temp_c} °C\n\N{BLACK DROPLET} {hum_p} %')
-        # kitchen ble data
-        temp_c = fmt_value(Tags.BLE_SENSOR_DATA.get(path=('kitchen', 'temp_c')), fmt='>6.1f')
-        hum_p = fmt_value(Tags.BLE_SENSOR_DATA.get(path=('kitchen', 'hum_p')), fmt='>6.1f')
-        self.tl_kit.load(txt=f'Cuisine\n\n\N{THERMOMETER} {temp_c} °C\n\N{BLACK DROPLET} {hum_p} %')
+        if self.tags_changed(Tags.IMG_TRAFFIC_MAP):
+            self.tl_tf_map.load(Tags.IMG_TRAFFIC_MAP.get(), crop=(30, 0, 530, 328))
+        # ble data
+        if self.tags_changed(Tags.BLE_SENSOR_DATA):
+            ble = Tags.BLE_SENSOR_DATA.get()
+            for tile, title, sensor in self._ble_tiles:
+                temp_c = fmt_value(dict_path(ble, (sensor, 'temp_c')), fmt='>6.1f')
+                hum_p = fmt_value(dict_path(ble, (sensor, 'hum_p')), fmt='>6.1f')
+                tile.load(txt=f'{title}\n\n\N{THERMOMETER} {temp_c} °C\n\N{BLACK DROPLET} {hum_p} %')
         # metar data
-        update_fr = fmt_value(Tags.METAR_DATA.get(path='update_fr'), fmt='', alt_str='\t')
-        press_hpa = fmt_value(Tags.METAR_DATA.get(path='press'), fmt='>5.0f')
-        temp_c = fmt_value(Tags.METAR_DATA.get(path='temp'), fmt='>8.1f', alt_str='   n/a')
-        dewpt_c = fmt_value(Tags.METAR_DATA.get(path='dewpt'), fmt='>6.1f')
-        w_speed_kmh = fmt_value(Tags.METAR_DATA.get(path='w_speed'), fmt='>3.0f')
-        w_dir = fmt_value(Tags.METAR_DATA.get(path='w_dir'), fmt='')
-        w_gust_kmh = fmt_value(Tags.METAR_DATA.get(path='w_gust'), fmt='>3.0f', alt_str='')
-        w_gust_kmh_str = f'(\N{LEAF FLUTTERING IN WIND} {w_gust_kmh} km/h)' if w_gust_kmh else ''
-        self.tl_metar.load(txt=f'Lesquin (station Météo-France)\n'
-                           f'{update_fr}\t\N{TIMER CLOCK} {press_hpa} hPa\n'
-                           f'\N{THERMOMETER} {temp_c} °C'
-                           f'\t\N{WIND BLOWING FACE} {w_speed_kmh} km/h\n'
-                           f'\N{THERMOMETER}\N{BLACK DROPLET} {dewpt_c} °C  '
-                           f'\t\N{WHITE-FEATHERED RIGHTWARDS ARROW}   {w_dir}'
-                           f' {w_gust_kmh_str}')
+        if self.tags_changed(Tags.METAR_DATA):
+            metar = Tags.METAR_DATA.get()
+            update_fr = fmt_value(dict_path(metar, 'update_fr'), fmt='', alt_str='\t')
+            press_hpa = fmt_value(dict_path(metar, 'press'), fmt='>5.0f')
+            temp_c = fmt_value(dict_path(metar, 'temp'), fmt='>8.1f', alt_str='   n/a')
+            dewpt_c = fmt_value(dict_path(metar, 'dewpt'), fmt='>6.1f')
+            w_speed_kmh = fmt_value(dict_path(metar, 'w_speed'), fmt='>3.0f')
+            w_dir = fmt_value(dict_path(metar, 'w_dir'), fmt='')
+            w_gust_kmh = fmt_value(dict_path(metar, 'w_gust'), fmt='>3.0f', alt_str='')
+            w_gust_kmh_str = f'(\N{LEAF FLUTTERING IN WIND} {w_gust_kmh} km/h)' if w_gust_kmh else ''
+            self.tl_metar.load(txt=f'Lesquin (station Météo-France)\n'
+                               f'{update_fr}\t\N{TIMER CLOCK} {press_hpa} hPa\n'
+                               f'\N{THERMOMETER} {temp_c} °C'
+                               f'\t\N{WIND BLOWING FACE} {w_speed_kmh} km/h\n'
+                               f'\N{THERMOMETER}\N{BLACK DROPLET} {dewpt_c} °C  '
+                               f'\t\N{WHITE-FEATHERED RIGHTWARDS ARROW}   {w_dir}'
+                               f' {w_gust_kmh_str}')
 
 
 # main
@@ -4,8 +4,8 @@ import base64
 import os
 
 
-# build fernet key for use with python cryptography package
-key = base64.urlsafe_b64encode(os.urandom(32))
+# build fernet key for use with python cryptography package (need the '=' padding, so no secrets.token_urlsafe())
+key = base64.urlsafe_b64encode(os.urandom(32)).decode()
 
 # print result
 print(f'key     {key}')
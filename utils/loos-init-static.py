@@ -5,5 +5,6 @@ from data.static import DATA_0, DATA_1
 
 
 red_cli = redis.StrictRedis(host='localhost', username=None, password=None)
-red_cli.set(b'img:static:logo-atmo-hdf:png', DATA_0)
-red_cli.set(b'img:static:logo-grt:png', DATA_1)
+# set all static items at once (a single round trip, no partial update)
+red_cli.mset({b'img:static:logo-atmo-hdf:png': DATA_0,
+              b'img:static:logo-grt:png': DATA_1})